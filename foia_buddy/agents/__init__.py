@@ -1,13 +1,35 @@
+import importlib
+
 from .base import BaseAgent, AgentRegistry
-from .coordinator import CoordinatorAgent
-from .document_researcher import DocumentResearcherAgent
-from .report_generator import ReportGeneratorAgent
-from .public_foia_search import PublicFOIASearchAgent
-from .local_pdf_search import LocalPDFSearchAgent
-from .pdf_parser import PDFParserAgent
-from .html_report_generator import HTMLReportGeneratorAgent
-from .interactive_ui_generator import InteractiveUIGeneratorAgent
-from .launcher_ui_generator import LauncherUIGeneratorAgent
+
+# Agent classes are imported on first access so using one agent does not
+# pay the import cost of all the others.
+_LAZY_AGENTS = {
+    "CoordinatorAgent": ".coordinator",
+    "DocumentResearcherAgent": ".document_researcher",
+    "ReportGeneratorAgent": ".report_generator",
+    "PublicFOIASearchAgent": ".public_foia_search",
+    "LocalPDFSearchAgent": ".local_pdf_search",
+    "PDFParserAgent": ".pdf_parser",
+    "HTMLReportGeneratorAgent": ".html_report_generator",
+    "InteractiveUIGeneratorAgent": ".interactive_ui_generator",
+    "LauncherUIGeneratorAgent": ".launcher_ui_generator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_AGENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_AGENTS))
+
 
 __all__ = [
     "BaseAgent",
@@ -21,4 +43,4 @@ __all__ = [
     "HTMLReportGeneratorAgent",
     "InteractiveUIGeneratorAgent",
     "LauncherUIGeneratorAgent"
-]
\ No newline at end of file
+]
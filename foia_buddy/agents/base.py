@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
+import asyncio
+import functools
 import time
 from ..models import AgentResult, TaskMessage
-from ..utils import NvidiaClient
+from ..utils import NvidiaClient, ResponseCache
 
 
 class BaseAgent(ABC):
     """Base class for all FOIA-Buddy agents."""
 
+    # Shared across agents so identical prompts from any agent reuse a response
+    response_cache = ResponseCache()
+
     def __init__(self, name: str, description: str, nvidia_client: NvidiaClient):
         self.name = name
         self.description = description
@@ -35,14 +40,31 @@ class BaseAgent(ABC):
 
     async def _generate_response(
         self,
-        messages: List[Dict[str, str]],
+        messages: List[Dict[str, Any]],
         use_thinking: bool = True
     ) -> Dict[str, Any]:
-        """Generate response using Nemotron model."""
-        return self.nvidia_client.generate_response(
-            messages=messages,
-            use_thinking=use_thinking
+        """Generate response using Nemotron model.
+
+        The client is synchronous, so the call runs in a worker thread to keep
+        the event loop free for other in-flight agent requests. Successful
+        responses are cached by message content and thinking mode.
+        """
+        cache_key = ResponseCache.make_key(messages, use_thinking)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.nvidia_client.generate_response,
+                messages=messages,
+                use_thinking=use_thinking
+            )
         )
+        self.response_cache.set(cache_key, response)
+        return response
 
     def _create_result(
         self,
@@ -53,7 +75,10 @@ class BaseAgent(ABC):
         confidence: float,
         start_time: float
     ) -> AgentResult:
-        """Create standardized agent result."""
+        """Create standardized agent result.
+
+        ``start_time`` must come from ``time.perf_counter()``.
+        """
         return AgentResult(
             agent_name=self.name,
             task_id=task_id,
@@ -61,7 +86,7 @@ class BaseAgent(ABC):
             data=data,
             reasoning=reasoning,
             confidence=confidence,
-            execution_time=time.time() - start_time
+            execution_time=time.perf_counter() - start_time
         )
 
 
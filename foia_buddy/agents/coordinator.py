@@ -5,21 +5,14 @@ from .base import BaseAgent
 from ..models import AgentResult, TaskMessage, FOIARequest
 
 
+# Reused for raw_decode, which parses one object and ignores trailing text
+_JSON_DECODER = json.JSONDecoder()
+
+
 class CoordinatorAgent(BaseAgent):
     """Coordinates FOIA request processing across multiple specialized agents."""
 
-    def __init__(self, nvidia_client):
-        super().__init__(
-            name="coordinator",
-            description="Orchestrates FOIA request processing using ReAct pattern reasoning",
-            nvidia_client=nvidia_client
-        )
-        self.add_capability("request_analysis")
-        self.add_capability("agent_orchestration")
-        self.add_capability("planning")
-
-    def get_system_prompt(self) -> str:
-        return """You are the Coordinator Agent for FOIA-Buddy, an intelligent system that processes Freedom of Information Act requests.
+    _SYSTEM_PROMPT = """You are the Coordinator Agent for FOIA-Buddy, an intelligent system that processes Freedom of Information Act requests.
 
 Your role is to:
 1. ANALYZE incoming FOIA requests to understand what information is needed
@@ -46,9 +39,22 @@ Always respond with structured JSON containing:
 - priority: Overall priority level (1-5)
 - estimated_complexity: low/medium/high"""
 
+    def __init__(self, nvidia_client):
+        super().__init__(
+            name="coordinator",
+            description="Orchestrates FOIA request processing using ReAct pattern reasoning",
+            nvidia_client=nvidia_client
+        )
+        self.add_capability("request_analysis")
+        self.add_capability("agent_orchestration")
+        self.add_capability("planning")
+
+    def get_system_prompt(self) -> str:
+        return self._SYSTEM_PROMPT
+
     async def execute(self, task: TaskMessage) -> AgentResult:
         """Execute coordination task for FOIA request."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Parse FOIA request from task context
@@ -57,12 +63,11 @@ Always respond with structured JSON containing:
             messages = [
                 {"role": "system", "content": self.get_system_prompt()},
                 {"role": "user", "content": f"""
-Analyze this FOIA request and create an execution plan:
+Analyze the FOIA request below and create an execution plan.
+Provide a detailed analysis and execution plan for processing this request using available agents.
 
 FOIA REQUEST:
 {foia_content}
-
-Provide a detailed analysis and execution plan for processing this request using available agents.
 """}
             ]
 
@@ -84,15 +89,14 @@ Provide a detailed analysis and execution plan for processing this request using
 
             # Try to extract JSON from response
             try:
-                # Look for JSON in the response
-                import re
-                json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                if json_match:
-                    plan_data = json.loads(json_match.group())
+                # Look for JSON in the response, parsing from the first brace
+                json_start = content.find('{')
+                if json_start >= 0:
+                    plan_data = self._parse_plan_json(content, json_start)
                 else:
                     # Fallback: create structured plan from text
                     plan_data = self._parse_text_plan(content)
-            except:
+            except json.JSONDecodeError:
                 plan_data = self._parse_text_plan(content)
 
             # Create coordination result
@@ -122,6 +126,16 @@ Provide a detailed analysis and execution plan for processing this request using
                 start_time=start_time
             )
 
+    def _parse_plan_json(self, content: str, json_start: int) -> Dict[str, Any]:
+        """Parse the plan object that starts at json_start.
+
+        raw_decode finds the end of the object while parsing it, so braces in
+        text before or after the plan do not matter and the object is parsed
+        once.
+        """
+        plan_data, _ = _JSON_DECODER.raw_decode(content, json_start)
+        return plan_data
+
     def _parse_text_plan(self, content: str) -> Dict[str, Any]:
         """Parse text response into structured plan."""
         return {
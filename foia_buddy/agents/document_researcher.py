@@ -1,27 +1,120 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import asyncio
+import bisect
+import functools
+import hashlib
 import os
+import re
 import time
-from pathlib import Path
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from .base import BaseAgent
 from ..models import AgentResult, TaskMessage, DocumentResult
 
+# Dedicated pool for document reads, separate from the executor used for model
+# calls; created on first use by _get_document_read_executor
+_DOCUMENT_READ_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _get_document_read_executor() -> ThreadPoolExecutor:
+    """Return the shared pool for document reads, creating it on first use."""
+    global _DOCUMENT_READ_EXECUTOR
+    if _DOCUMENT_READ_EXECUTOR is None:
+        _DOCUMENT_READ_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="document-read")
+    return _DOCUMENT_READ_EXECUTOR
+
+
+# Redaction heuristics, matched against lowercased content in one pass
+_REDACTION_PATTERN = re.compile(
+    r"(?P<ssn>ssn|social security)"
+    r"|(?P<at_sign>@)"
+    r"|(?P<email>email)"
+    r"|(?P<phone>phone|tel:)"
+    r"|(?P<classified>classified|confidential)"
+)
+_REDACTION_GROUPS = frozenset(_REDACTION_PATTERN.groupindex)
+
+@functools.lru_cache(maxsize=32)
+def _keyword_occurrences(foia_words: Tuple[str, ...]) -> Tuple[Tuple[str, int], ...]:
+    """Collapse request words into distinct keywords with their repeat counts.
+
+    Cached so scoring a whole corpus against one request tokenizes it once.
+    """
+    return tuple(Counter(word for word in foia_words if len(word) > 2).items())
+
+
+def _extract_relevant_sections(content: str, content_lower: str, foia_words: Sequence[str]) -> List[str]:
+    """Extract relevant sections from document content.
+
+    A paragraph qualifies when request words occur in it at least twice,
+    counting a word repeated in the request once per repeat.
+    """
+    keyword_counts = dict(_keyword_occurrences(tuple(foia_words)))
+    if not keyword_counts:
+        return []
+    foia_keywords = keyword_counts.keys()
+
+    # One regex pass over the whole document. The lookahead reports the
+    # longest keyword starting at every position; keywords contained in a
+    # match are credited through `implied` so counts match substring tests.
+    keyword_pattern = re.compile(
+        "(?=(" + "|".join(re.escape(keyword) for keyword in sorted(foia_keywords, key=len, reverse=True)) + "))"
+    )
+    implied = {
+        keyword: {other for other in foia_keywords if other in keyword}
+        for keyword in foia_keywords
+    }
+
+    # Split content into paragraphs, tracking where each starts in the lowercased text
+    paragraphs = content.split('\n\n')
+    lower_paragraphs = content_lower.split('\n\n')
+    paragraph_starts = []
+    offset = 0
+    for para_lower in lower_paragraphs:
+        paragraph_starts.append(offset)
+        offset += len(para_lower) + 2
+
+    paragraph_keywords = [set() for _ in paragraphs]
+    for match in keyword_pattern.finditer(content_lower):
+        paragraph_keywords[bisect.bisect_right(paragraph_starts, match.start()) - 1].update(implied[match.group(1)])
+
+    sections = []
+    for para, keywords in zip(paragraphs, paragraph_keywords):
+        keyword_count = sum(keyword_counts[keyword] for keyword in keywords)
+        if len(para) > 50 and keyword_count >= 2:  # Skip very short paragraphs; at least 2 keyword matches
+            sections.append(para.strip()[:500] + "..." if len(para) > 500 else para.strip())
+            if len(sections) == 3:  # Top 3 relevant sections
+                break
+
+    return sections
+
+
+def _identify_redaction_flags(content_lower: str) -> List[str]:
+    """Identify content that may need redaction."""
+    # Simple PII detection in a single scan over the document
+    found = set()
+    for match in _REDACTION_PATTERN.finditer(content_lower):
+        found.add(match.lastgroup)
+        if len(found) == len(_REDACTION_GROUPS):
+            break
+
+    flags = []
+    if "ssn" in found:
+        flags.append("Potential SSN")
+    if "at_sign" in found and "email" in found:
+        flags.append("Email addresses")
+    if "phone" in found:
+        flags.append("Phone numbers")
+    if "classified" in found:
+        flags.append("Classified information")
+
+    return flags
+
 
 class DocumentResearcherAgent(BaseAgent):
     """Searches and analyzes local markdown documents for FOIA-relevant information."""
 
-    def __init__(self, nvidia_client, document_directory: str = "sample_data/documents"):
-        super().__init__(
-            name="document_researcher",
-            description="Searches local document repositories using semantic analysis",
-            nvidia_client=nvidia_client
-        )
-        self.document_directory = document_directory
-        self.add_capability("document_search")
-        self.add_capability("content_analysis")
-        self.add_capability("relevance_scoring")
-
-    def get_system_prompt(self) -> str:
-        return """You are the Document Researcher Agent for FOIA-Buddy.
+    _SYSTEM_PROMPT = """You are the Document Researcher Agent for FOIA-Buddy.
 
 Your role is to:
 1. SEARCH through local document repositories for information relevant to FOIA requests
@@ -42,25 +135,76 @@ Always respond with structured analysis including:
 - summary: Brief summary of the document's relevance
 - redaction_flags: Any content that may need redaction"""
 
+    def __init__(
+        self,
+        nvidia_client,
+        document_directory: str = "sample_data/documents",
+        max_concurrency: int = 16,
+        max_llm_documents: int = 20,
+        max_prompt_chars: int = 2000
+    ):
+        super().__init__(
+            name="document_researcher",
+            description="Searches local document repositories using semantic analysis",
+            nvidia_client=nvidia_client
+        )
+        self.document_directory = document_directory
+        self.max_concurrency = max_concurrency
+        self.max_llm_documents = max_llm_documents
+        self.max_prompt_chars = max_prompt_chars
+        self.add_capability("document_search")
+        self.add_capability("content_analysis")
+        self.add_capability("relevance_scoring")
+
+    def get_system_prompt(self) -> str:
+        return self._SYSTEM_PROMPT
+
     async def execute(self, task: TaskMessage) -> AgentResult:
         """Execute document research task."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Get search parameters from task
             search_query = task.context.get("search_query", "")
             foia_request = task.context.get("foia_request", "")
 
-            # Find and analyze documents
+            # Read all documents, then keep only the best keyword matches for LLM analysis
             documents = self._find_documents()
-            analyzed_docs = []
-
-            for doc_path in documents:
-                doc_content = self._read_document(doc_path)
-                if doc_content:
-                    analysis = await self._analyze_document(doc_content, foia_request, doc_path)
-                    if analysis["relevance_score"] > 0.1:  # Only include relevant docs
-                        analyzed_docs.append(analysis)
+            contents = await asyncio.gather(
+                *(self._read_document_async(doc_path) for doc_path in documents)
+            )
+            candidates = self._prefilter_documents(documents, contents, foia_request)
+
+            # Analyze candidates concurrently, bounded by max_concurrency
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def analyze(doc_path: str, doc_content: str, content_lower: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._analyze_document(
+                        doc_content, foia_request, doc_path, content_lower=content_lower
+                    )
+
+            # Identical documents (e.g. copies in several folders) are analyzed once
+            unique_candidates = {}
+            candidate_digests = []
+            for candidate in candidates:
+                digest = hashlib.blake2b(candidate[1].encode('utf-8'), digest_size=16).hexdigest()
+                unique_candidates.setdefault(digest, candidate)
+                candidate_digests.append((candidate[0], digest))
+
+            unique_analyses = dict(zip(
+                unique_candidates,
+                await asyncio.gather(*(analyze(*candidate) for candidate in unique_candidates.values()))
+            ))
+            analyses = [
+                unique_analyses[digest] if unique_analyses[digest]["file_path"] == doc_path
+                else {**unique_analyses[digest], "file_path": doc_path}
+                for doc_path, digest in candidate_digests
+            ]
+            analyzed_docs = [
+                analysis for analysis in analyses
+                if analysis["relevance_score"] > 0.1  # Only include relevant docs
+            ]
 
             # Sort by relevance score
             analyzed_docs.sort(key=lambda x: x["relevance_score"], reverse=True)
@@ -95,40 +239,97 @@ Always respond with structured analysis including:
 
     def _find_documents(self) -> List[str]:
         """Find all markdown documents in the document directory."""
-        doc_dir = Path(self.document_directory)
-        if not doc_dir.exists():
+        if not os.path.isdir(self.document_directory):
             return []
 
+        # os.walk avoids building a Path object and fnmatch check per entry
         markdown_files = []
-        for file_path in doc_dir.rglob("*.md"):
-            markdown_files.append(str(file_path))
+        for dirpath, _, filenames in os.walk(self.document_directory):
+            for filename in filenames:
+                if filename.endswith(".md"):
+                    markdown_files.append(os.path.join(dirpath, filename))
 
         return markdown_files
 
     def _read_document(self, file_path: str) -> str:
         """Read document content."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Read raw bytes in one call and decode once, skipping the text-mode wrapper
+            with open(file_path, 'rb') as f:
+                content = f.read().decode('utf-8')
         except Exception:
             return ""
-
-    async def _analyze_document(self, content: str, foia_request: str, file_path: str) -> Dict[str, Any]:
-        """Analyze a document for relevance to FOIA request."""
-
+        # Normalize line endings as text mode would, so CRLF documents still
+        # split into paragraphs on blank lines
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+
+    async def _read_document_async(self, file_path: str) -> str:
+        """Read document content in a worker thread so reads overlap in-flight LLM calls.
+
+        Reads use their own thread pool so they never queue behind model
+        requests occupying the default executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_document_read_executor(), self._read_document, file_path)
+
+    def _prefilter_documents(
+        self,
+        documents: List[str],
+        contents: List[str],
+        foia_request: str
+    ) -> List[Tuple[str, str, str]]:
+        """Select documents worth an LLM call using a local keyword score.
+
+        Documents that match no FOIA keywords are skipped, and only the
+        top ``max_llm_documents`` matches are returned as
+        ``(path, content, lowercased content)`` tuples.
+        """
+        foia_words = self._split_request_words(foia_request)
+        scored = []
+        for doc_path, doc_content in zip(documents, contents):
+            if not doc_content:
+                continue
+            content_lower = doc_content.lower()
+            score = self._keyword_match_score(content_lower, foia_words)
+            if score > 0:
+                scored.append((score, doc_path, doc_content, content_lower))
+
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [candidate[1:] for candidate in scored[:self.max_llm_documents]]
+
+    async def _analyze_document(
+        self,
+        content: str,
+        foia_request: str,
+        file_path: str,
+        content_lower: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Analyze a document for relevance to FOIA request.
+
+        Only the first ``max_prompt_chars`` characters are sent to the model;
+        the full text is still used for local scoring. Pass ``content_lower``
+        when the caller has already lowercased the document.
+        """
+        # Lowercase the document and split the request once for all heuristics
+        if content_lower is None:
+            content_lower = content.lower()
+        foia_words = self._split_request_words(foia_request)
+
+        # The local scans are single regex passes, cheaper than shipping the
+        # document to another thread or process
+        relevant_sections = _extract_relevant_sections(content, content_lower, foia_words)
+        redaction_flags = _identify_redaction_flags(content_lower)
+
+        # Everything shared by all documents in a run comes first, so the
+        # server can reuse the cached prompt prefix; the document is the suffix.
         messages = [
             {"role": "system", "content": self.get_system_prompt()},
-            {"role": "user", "content": f"""
-Analyze this document for relevance to the FOIA request:
-
-FOIA REQUEST:
-{foia_request}
-
+            {"role": "user", "content": self._build_analysis_prefix(foia_request) + f"""
 DOCUMENT PATH: {file_path}
 DOCUMENT CONTENT:
-{content[:2000]}{"..." if len(content) > 2000 else ""}
-
-Provide structured analysis with relevance scoring and key findings.
+{content[:self.max_prompt_chars]}{"..." if len(content) > self.max_prompt_chars else ""}
 """}
         ]
 
@@ -149,26 +350,35 @@ Provide structured analysis with relevance scoring and key findings.
         analysis_text = response["content"]
 
         # Extract relevance score using simple heuristics
-        relevance_score = self._extract_relevance_score(analysis_text, content, foia_request)
+        relevance_score = self._extract_relevance_score(analysis_text, content_lower, foia_words)
 
         return {
             "file_path": file_path,
             "relevance_score": relevance_score,
             "key_findings": self._extract_key_findings(analysis_text),
-            "relevant_sections": self._extract_relevant_sections(content, foia_request),
+            "relevant_sections": relevant_sections,
             "summary": analysis_text[:300] + "..." if len(analysis_text) > 300 else analysis_text,
-            "redaction_flags": self._identify_redaction_flags(content),
+            "redaction_flags": redaction_flags,
             "full_analysis": analysis_text
         }
 
-    def _extract_relevance_score(self, analysis: str, content: str, foia_request: str) -> float:
-        """Extract or calculate relevance score."""
-        # Simple keyword matching approach
-        foia_keywords = foia_request.lower().split()
-        content_lower = content.lower()
+    def _build_analysis_prefix(self, foia_request: str) -> str:
+        """Build the user-prompt prefix that is identical for every document."""
+        return f"""
+Analyze the document below for relevance to the FOIA request.
+Provide structured analysis with relevance scoring and key findings.
+
+FOIA REQUEST:
+{foia_request}
+"""
 
-        matches = sum(1 for keyword in foia_keywords if keyword in content_lower and len(keyword) > 2)
-        score = min(matches / max(len(foia_keywords), 1), 1.0)
+    def _split_request_words(self, foia_request: str) -> Tuple[str, ...]:
+        """Split the FOIA request into lowercase words."""
+        return tuple(foia_request.lower().split())
+
+    def _extract_relevance_score(self, analysis: str, content_lower: str, foia_words: Tuple[str, ...]) -> float:
+        """Extract or calculate relevance score."""
+        score = self._keyword_match_score(content_lower, foia_words)
 
         # Boost score if analysis seems positive
         if any(word in analysis.lower() for word in ["relevant", "important", "addresses", "contains"]):
@@ -176,6 +386,15 @@ Provide structured analysis with relevance scoring and key findings.
 
         return score
 
+    def _keyword_match_score(self, content_lower: str, foia_words: Tuple[str, ...]) -> float:
+        """Score a document by the fraction of FOIA request words it contains."""
+        # Simple keyword matching approach, one substring test per distinct keyword
+        matches = sum(
+            occurrences for keyword, occurrences in _keyword_occurrences(foia_words)
+            if keyword in content_lower
+        )
+        return min(matches / max(len(foia_words), 1), 1.0)
+
     def _extract_key_findings(self, analysis: str) -> List[str]:
         """Extract key findings from analysis text."""
         # Simple extraction - look for bullet points or numbered lists
@@ -190,38 +409,3 @@ Provide structured analysis with relevance scoring and key findings.
                 findings.append(line)
 
         return findings[:5]  # Top 5 findings
-
-    def _extract_relevant_sections(self, content: str, foia_request: str) -> List[str]:
-        """Extract relevant sections from document content."""
-        sections = []
-        foia_keywords = [word.lower() for word in foia_request.split() if len(word) > 2]
-
-        # Split content into paragraphs
-        paragraphs = content.split('\n\n')
-
-        for para in paragraphs:
-            if len(para) > 50:  # Skip very short paragraphs
-                para_lower = para.lower()
-                keyword_count = sum(1 for keyword in foia_keywords if keyword in para_lower)
-
-                if keyword_count >= 2:  # At least 2 keyword matches
-                    sections.append(para.strip()[:500] + "..." if len(para) > 500 else para.strip())
-
-        return sections[:3]  # Top 3 relevant sections
-
-    def _identify_redaction_flags(self, content: str) -> List[str]:
-        """Identify content that may need redaction."""
-        flags = []
-        content_lower = content.lower()
-
-        # Simple PII detection
-        if "ssn" in content_lower or "social security" in content_lower:
-            flags.append("Potential SSN")
-        if "@" in content and "email" in content_lower:
-            flags.append("Email addresses")
-        if "phone" in content_lower or "tel:" in content_lower:
-            flags.append("Phone numbers")
-        if "classified" in content_lower or "confidential" in content_lower:
-            flags.append("Classified information")
-
-        return flags
\ No newline at end of file
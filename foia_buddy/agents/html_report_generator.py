@@ -1,196 +1,82 @@
-from typing import Dict, Any, List
-import json
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, TextIO, Tuple
+import functools
+import html
+import io
+import re
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
+from string import Template
+from types import MappingProxyType
 from .base import BaseAgent
 from ..models import AgentResult, TaskMessage
+from ..utils import fast_json
+from ..utils.minify import minify_css
 
 
-class HTMLReportGeneratorAgent(BaseAgent):
-    """Generates interactive HTML reports from processing metadata with Mermaid diagrams."""
-
-    def __init__(self, nvidia_client):
-        super().__init__(
-            name="html_report_generator",
-            description="Creates interactive HTML reports with visual diagrams from processing metadata",
-            nvidia_client=nvidia_client
-        )
-        self.add_capability("html_generation")
-        self.add_capability("visualization")
-        self.add_capability("metadata_analysis")
-
-    def get_system_prompt(self) -> str:
-        return """You are the HTML Report Generator Agent for FOIA-Buddy.
-
-Your role is to:
-1. ANALYZE processing metadata from FOIA request processing
-2. CREATE interactive HTML reports with visual elements
-3. GENERATE Mermaid diagrams showing agent execution flows
-4. PRESENT data in a clear, professional, and visually appealing format
-
-Report Requirements:
-- Professional HTML5 structure with embedded CSS
-- Responsive design that works on all devices
-- Interactive Mermaid.js diagrams showing agent workflows
-- Clear presentation of processing metrics and timelines
-- Detailed breakdown of each agent's contribution
-- Visual indicators for success/failure states
-
-Always create well-structured, accessible HTML with modern design principles."""
-
-    async def execute(self, task: TaskMessage) -> AgentResult:
-        """Execute HTML report generation task."""
-        start_time = time.time()
-
-        try:
-            # Get metadata file path from task context
-            metadata_path = task.context.get("metadata_path", "")
-            output_path = task.context.get("output_path", "")
-
-            if not metadata_path or not Path(metadata_path).exists():
-                return self._create_result(
-                    task.task_id,
-                    success=False,
-                    data={"error": f"Metadata file not found: {metadata_path}"},
-                    reasoning="Cannot generate report without metadata file",
-                    confidence=0.0,
-                    start_time=start_time
-                )
-
-            # Read and parse metadata
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-
-            # Generate HTML report
-            html_content = self._generate_html_report(metadata)
-
-            # Save HTML report
-            if output_path:
-                output_file = Path(output_path)
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-
-            result_data = {
-                "html_content": html_content,
-                "output_file": str(output_path) if output_path else None,
-                "report_sections": [
-                    "Summary",
-                    "Agent Execution Timeline",
-                    "Execution Flow Diagram",
-                    "Detailed Agent Results"
-                ],
-                "generation_metadata": {
-                    "generated_at": datetime.now().isoformat(),
-                    "metadata_processed": metadata_path
-                }
-            }
-
-            return self._create_result(
-                task.task_id,
-                success=True,
-                data=result_data,
-                reasoning="Successfully generated interactive HTML report with execution diagram",
-                confidence=0.95,
-                start_time=start_time
-            )
-
-        except Exception as e:
-            return self._create_result(
-                task.task_id,
-                success=False,
-                data={"error": str(e)},
-                reasoning=f"Error during HTML report generation: {str(e)}",
-                confidence=0.0,
-                start_time=start_time
-            )
-
-    def _generate_html_report(self, metadata: Dict[str, Any]) -> str:
-        """Generate the complete HTML report."""
-
-        # Extract key information
-        agent_results = metadata.get("agent_results", {})
-        processing_start = metadata.get("processing_start", 0)
-        total_time = metadata.get("processing_time", 0)
-        input_file = metadata.get("input_file", "Unknown")
-        output_dir = metadata.get("output_directory", "Unknown")
-        status = metadata.get("status", "unknown")
-
-        # Generate sections
-        summary_html = self._generate_summary_section(metadata)
-        timeline_html = self._generate_timeline_section(agent_results)
-        mermaid_diagram = self._generate_mermaid_diagram(agent_results)
-        details_html = self._generate_details_section(agent_results)
-
-        # Build complete HTML
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>FOIA-Buddy Processing Report</title>
-    <script src="https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js"></script>
-    <style>
-        * {{
+# Static report stylesheet, kept out of the template so it is built once
+_STATIC_CSS = """\
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             line-height: 1.6;
             color: #333;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 20px;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 12px;
             box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
             overflow: hidden;
-        }}
+        }
 
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
             font-weight: 700;
-        }}
+        }
 
-        .header p {{
+        .header p {
             font-size: 1.1em;
             opacity: 0.9;
-        }}
+        }
 
-        .content {{
+        .content {
             padding: 40px;
-        }}
+        }
 
-        .section {{
+        .section {
             margin-bottom: 40px;
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             font-size: 1.8em;
             color: #667eea;
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 3px solid #667eea;
             font-weight: 600;
-        }}
+        }
 
-        .status-badge {{
+        .status-badge {
             display: inline-block;
             padding: 8px 16px;
             border-radius: 20px;
@@ -198,55 +84,55 @@ Always create well-structured, accessible HTML with modern design principles."""
             text-transform: uppercase;
             font-size: 0.85em;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        .status-completed {{
+        .status-completed {
             background: #10b981;
             color: white;
-        }}
+        }
 
-        .status-failed {{
+        .status-failed {
             background: #ef4444;
             color: white;
-        }}
+        }
 
-        .status-unknown {{
+        .status-unknown {
             background: #6b7280;
             color: white;
-        }}
+        }
 
-        .metrics {{
+        .metrics {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin: 20px 0;
-        }}
+        }
 
-        .metric-card {{
+        .metric-card {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 25px;
             border-radius: 10px;
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }}
+        }
 
-        .metric-label {{
+        .metric-label {
             font-size: 0.9em;
             opacity: 0.9;
             margin-bottom: 8px;
-        }}
+        }
 
-        .metric-value {{
+        .metric-value {
             font-size: 2em;
             font-weight: 700;
-        }}
+        }
 
-        .timeline {{
+        .timeline {
             position: relative;
             padding-left: 40px;
-        }}
+        }
 
-        .timeline::before {{
+        .timeline::before {
             content: '';
             position: absolute;
             left: 10px;
@@ -254,18 +140,18 @@ Always create well-structured, accessible HTML with modern design principles."""
             bottom: 0;
             width: 3px;
             background: #667eea;
-        }}
+        }
 
-        .timeline-item {{
+        .timeline-item {
             position: relative;
             margin-bottom: 30px;
             padding: 20px;
             background: #f9fafb;
             border-radius: 8px;
             border-left: 4px solid #667eea;
-        }}
+        }
 
-        .timeline-item::before {{
+        .timeline-item::before {
             content: '';
             position: absolute;
             left: -47px;
@@ -276,146 +162,159 @@ Always create well-structured, accessible HTML with modern design principles."""
             background: #667eea;
             border: 3px solid white;
             box-shadow: 0 0 0 3px #667eea;
-        }}
+        }
 
-        .timeline-item.success::before {{
+        .timeline-item.success::before {
             background: #10b981;
             box-shadow: 0 0 0 3px #10b981;
-        }}
+        }
 
-        .timeline-item.failed::before {{
+        .timeline-item.failed::before {
             background: #ef4444;
             box-shadow: 0 0 0 3px #ef4444;
-        }}
+        }
 
-        .timeline-header {{
+        .timeline-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 10px;
-        }}
+        }
 
-        .agent-name {{
+        .agent-name {
             font-size: 1.3em;
             font-weight: 600;
             color: #667eea;
-        }}
+        }
 
-        .execution-time {{
+        .execution-time {
             font-size: 0.9em;
             color: #6b7280;
             background: white;
             padding: 4px 12px;
             border-radius: 12px;
-        }}
+        }
 
-        .diagram-container {{
+        .diagram-container {
             background: #f9fafb;
             padding: 30px;
             border-radius: 10px;
             margin: 20px 0;
             display: flex;
             justify-content: center;
-        }}
+        }
 
-        .agent-details {{
+        .agent-details {
             margin-top: 40px;
-        }}
+        }
 
-        .agent-card {{
+        .agent-card {
             background: white;
             border: 2px solid #e5e7eb;
             border-radius: 10px;
             padding: 25px;
             margin-bottom: 25px;
             transition: all 0.3s ease;
-        }}
+        }
 
-        .agent-card:hover {{
+        .agent-card:hover {
             box-shadow: 0 8px 16px rgba(0, 0, 0, 0.1);
             border-color: #667eea;
-        }}
+        }
 
-        .agent-card-header {{
+        .agent-card-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 20px;
-        }}
+        }
 
-        .confidence-badge {{
+        .confidence-badge {
             background: #fef3c7;
             color: #92400e;
             padding: 6px 12px;
             border-radius: 12px;
             font-weight: 600;
             font-size: 0.85em;
-        }}
+        }
 
-        .confidence-high {{
+        .confidence-high {
             background: #d1fae5;
             color: #065f46;
-        }}
+        }
 
-        .data-section {{
+        .data-section {
             background: #f9fafb;
             padding: 15px;
             border-radius: 8px;
             margin-top: 15px;
-        }}
+        }
 
-        .data-section h4 {{
+        .data-section h4 {
             color: #667eea;
             margin-bottom: 10px;
-        }}
+        }
 
-        .data-section pre {{
+        .data-section pre {
             background: white;
             padding: 15px;
             border-radius: 6px;
             overflow-x: auto;
             font-size: 0.9em;
-        }}
+        }
 
-        .reasoning-box {{
+        .reasoning-box {
             background: #fef3c7;
             border-left: 4px solid #f59e0b;
             padding: 15px;
             border-radius: 6px;
             margin-top: 15px;
-        }}
+        }
 
-        .reasoning-box h4 {{
+        .reasoning-box h4 {
             color: #92400e;
             margin-bottom: 8px;
-        }}
+        }
 
-        .reasoning-box p {{
+        .reasoning-box p {
             color: #78350f;
             line-height: 1.6;
-        }}
+        }
 
-        footer {{
+        footer {
             background: #f9fafb;
             padding: 20px;
             text-align: center;
             color: #6b7280;
             font-size: 0.9em;
-        }}
+        }
 
-        @media (max-width: 768px) {{
-            .metrics {{
+        @media (max-width: 768px) {
+            .metrics {
                 grid-template-columns: 1fr;
-            }}
+            }
 
-            .header h1 {{
+            .header h1 {
                 font-size: 1.8em;
-            }}
+            }
 
-            .content {{
+            .content {
                 padding: 20px;
-            }}
-        }}
+            }
+        }"""
+
+
+# Report skeleton, parsed once at import. string.Template placeholders leave
+# the CSS and JavaScript braces untouched.
+_HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>FOIA-Buddy Processing Report</title>
+    <script src="https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js"></script>
+    <style>
+$css
     </style>
 </head>
 <body>
@@ -426,19 +325,19 @@ Always create well-structured, accessible HTML with modern design principles."""
         </div>
 
         <div class="content">
-            {summary_html}
-            {timeline_html}
+            $summary_html
+            $timeline_html
 
             <div class="section">
                 <h2 class="section-title">🔄 Agent Execution Flow</h2>
                 <div class="diagram-container">
                     <div class="mermaid">
-{mermaid_diagram}
+$mermaid_diagram
                     </div>
                 </div>
             </div>
 
-            {details_html}
+            $details_html
         </div>
 
         <footer>
@@ -448,37 +347,426 @@ Always create well-structured, accessible HTML with modern design principles."""
     </div>
 
     <script>
-        mermaid.initialize({{
+        mermaid.initialize({
             startOnLoad: true,
             theme: 'default',
-            themeVariables: {{
+            themeVariables: {
                 primaryColor: '#667eea',
                 primaryTextColor: '#fff',
                 primaryBorderColor: '#764ba2',
                 lineColor: '#667eea',
                 secondaryColor: '#764ba2',
                 tertiaryColor: '#f9fafb'
-            }}
-        }});
+            }
+        });
     </script>
 </body>
-</html>"""
+</html>""")
+
+
+# The skeleton split around its section placeholders, so sections can be
+# streamed between the static pieces
+(
+    _HTML_HEAD,
+    _HTML_BEFORE_TIMELINE,
+    _HTML_BEFORE_DIAGRAM,
+    _HTML_BEFORE_DETAILS,
+    _HTML_TAIL,
+) = re.split(
+    r"\$(?:summary_html|timeline_html|mermaid_diagram|details_html)",
+    _HTML_TEMPLATE.safe_substitute(css=minify_css(_STATIC_CSS))
+)
+
+# Fallback models by agent name when a result does not record one
+_DEFAULT_MODEL = "nvidia/nvidia-nemotron-nano-9b-v2"
+_MODEL_MAP: Mapping[str, str] = MappingProxyType({
+    "coordinator": "nvidia/nvidia-nemotron-nano-9b-v2",
+    "local_pdf_search": "nvidia/nvidia-nemotron-nano-9b-v2",
+    "pdf_parser": "nvidia/nemotron-nano-12b-v2-vl",
+    "document_researcher": "nvidia/nvidia-nemotron-nano-9b-v2",
+    "public_foia_search": "nvidia/nvidia-nemotron-nano-9b-v2",
+    "report_generator": "nvidia/nvidia-nemotron-nano-9b-v2",
+    "html_report_generator": "Direct Processing (Non-LLM)"
+})
+
+# Per-agent HTML fragments, formatted with str.format once per agent
+_TIMELINE_HEADER = """
+            <div class="section">
+                <h2 class="section-title">⏱️ Execution Timeline</h2>
+                <div class="timeline">
+                    """
+
+_TIMELINE_ITEM_FMT = """
+                <div class="timeline-item {status_class}">
+                    <div class="timeline-header">
+                        <div class="agent-name">
+                            {display_name}
+                        </div>
+                        <div class="execution-time">
+                            ⏱️ {execution_time}s
+                        </div>
+                    </div>
+                    <p><strong>Status:</strong> {status_label}</p>
+                    <p><strong>Confidence:</strong> {confidence}</p>
+                    <p><strong>Model:</strong> {model}</p>
+                    <p style="margin-top: 10px; color: #6b7280;">{reasoning_preview}...</p>
+                </div>
+            """
+
+_TIMELINE_FOOTER = """
+                </div>
+            </div>
+        """
+
+_DETAILS_HEADER = """
+            <div class="section agent-details">
+                <h2 class="section-title">🔍 Detailed Agent Results</h2>
+                """
+
+_DETAILS_CARD_FMT = """
+                <div class="agent-card">
+                    <div class="agent-card-header">
+                        <h3>{display_name}</h3>
+                        <div>
+                            <span class="status-badge {status_badge_class}">
+                                {status_text}
+                            </span>
+                            <span class="confidence-badge {confidence_class}">
+                                Confidence: {confidence}
+                            </span>
+                        </div>
+                    </div>
+
+                    <p><strong>Execution Time:</strong> {execution_time} seconds</p>
+                    <p><strong>Model Used:</strong> <code style="background: #f3f4f6; padding: 2px 6px; border-radius: 4px;">{model}</code></p>
+
+                    <div class="reasoning-box">
+                        <h4>🧠 Agent Reasoning</h4>
+                        <p>{reasoning}</p>
+                    </div>
+
+                    <div class="data-section">
+                        <h4>📦 Result Data</h4>
+                        <pre>{data_str}</pre>
+                    </div>
+                </div>
+            """
+
+_DETAILS_FOOTER = """
+            </div>
+        """
+
+
+# Mermaid node styles for the execution flow diagram
+_COORD_STYLE = "fill:#667eea,stroke:#764ba2,stroke-width:3px,color:#fff"
+_SUCCESS_STYLE = "fill:#10b981,stroke:#059669,stroke-width:2px,color:#fff"
+_FAIL_STYLE = "fill:#ef4444,stroke:#dc2626,stroke-width:2px,color:#fff"
+_END_STYLE = "fill:#764ba2,stroke:#667eea,stroke-width:3px,color:#fff"
+
+# Maximum characters of an agent's result data shown in the report
+_DATA_PREVIEW_CHARS = 2000
+
+# The report is streamed in many small writes; a large buffer turns them
+# into a few syscalls instead of one per 8 KB
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+class AgentView(NamedTuple):
+    """Report-ready fields for one agent, extracted once per report.
+
+    ``row`` holds the escaped and formatted values substituted into both the
+    timeline item and the details card.
+    """
+    name: str
+    success: bool
+    execution_time: float
+    display_name: str
+    node_id: str
+    row: Dict[str, str]
+
+
+# Agent names come from a small fixed set, so these transforms are cached
+_UNDERSCORE_TO_SPACE = str.maketrans({'_': ' '})
+_STRIP_UNDERSCORES = str.maketrans({'_': None})
+
+
+@functools.lru_cache(maxsize=32)
+def _display_name(agent_name: str) -> str:
+    """HTML-escaped, human-readable agent name, e.g. ``pdf_parser`` -> ``Pdf Parser``."""
+    return html.escape(agent_name.translate(_UNDERSCORE_TO_SPACE).title(), quote=False)
+
+
+@functools.lru_cache(maxsize=32)
+def _node_id(agent_name: str) -> str:
+    """Mermaid node identifier for an agent."""
+    return agent_name.translate(_STRIP_UNDERSCORES)
+
+
+def _preview_copy(data: Any, limit: int) -> Any:
+    """Copy data, keeping only what can appear in the first limit characters of its JSON.
+
+    Every value serializes to at least one character, so values past the
+    first ``limit`` are dropped and long strings are cut to ``limit``.
+    """
+    remaining = [limit]
+
+    def copy(value: Any) -> Any:
+        remaining[0] -= 1
+        if isinstance(value, str):
+            return value[:limit]
+        if isinstance(value, dict):
+            copied = {}
+            for key, item in value.items():
+                if remaining[0] <= 0:
+                    break
+                copied[key] = copy(item)
+            return copied
+        if isinstance(value, (list, tuple)):
+            copied = []
+            for item in value:
+                if remaining[0] <= 0:
+                    break
+                copied.append(copy(item))
+            return copied
+        return value
+
+    return copy(data)
+
+
+def _truncated_json(data: Any, limit: int) -> str:
+    """Serialize data as indented JSON, truncated to limit characters.
+
+    Only the part of the data the preview can show is serialized, using
+    orjson when it is installed.
+    """
+    data_str = fast_json.dumps(_preview_copy(data, limit + 1), indent=True)
+    if len(data_str) > limit:
+        data_str = data_str[:limit] + "\n... (truncated)"
+    return data_str
+
+
+class HTMLReportGeneratorAgent(BaseAgent):
+    """Generates interactive HTML reports from processing metadata with Mermaid diagrams."""
+
+    def __init__(self, nvidia_client):
+        super().__init__(
+            name="html_report_generator",
+            description="Creates interactive HTML reports with visual diagrams from processing metadata",
+            nvidia_client=nvidia_client
+        )
+        self.add_capability("html_generation")
+        self.add_capability("visualization")
+        self.add_capability("metadata_analysis")
+
+    def get_system_prompt(self) -> str:
+        return """You are the HTML Report Generator Agent for FOIA-Buddy.
+
+Your role is to:
+1. ANALYZE processing metadata from FOIA request processing
+2. CREATE interactive HTML reports with visual elements
+3. GENERATE Mermaid diagrams showing agent execution flows
+4. PRESENT data in a clear, professional, and visually appealing format
+
+Report Requirements:
+- Professional HTML5 structure with embedded CSS
+- Responsive design that works on all devices
+- Interactive Mermaid.js diagrams showing agent workflows
+- Clear presentation of processing metrics and timelines
+- Detailed breakdown of each agent's contribution
+- Visual indicators for success/failure states
+
+Always create well-structured, accessible HTML with modern design principles."""
+
+    async def execute(self, task: TaskMessage) -> AgentResult:
+        """Execute HTML report generation task."""
+        start_time = time.perf_counter()
+
+        try:
+            # Get metadata file path from task context
+            metadata_path = task.context.get("metadata_path", "")
+            output_path = task.context.get("output_path", "")
+
+            if not metadata_path or not Path(metadata_path).exists():
+                return self._create_result(
+                    task.task_id,
+                    success=False,
+                    data={"error": f"Metadata file not found: {metadata_path}"},
+                    reasoning="Cannot generate report without metadata file",
+                    confidence=0.0,
+                    start_time=start_time
+                )
+
+            # Nothing would consume the report: no file to write and the caller
+            # opted out of receiving the HTML
+            if not output_path and not task.context.get("return_html", True):
+                return self._create_result(
+                    task.task_id,
+                    success=True,
+                    data={
+                        "html_content": None,
+                        "output_file": None,
+                        "report_sections": [],
+                        "generation_metadata": {
+                            "generated_at": datetime.now().isoformat(),
+                            "metadata_processed": metadata_path
+                        }
+                    },
+                    reasoning="Skipped HTML report generation: no output path and HTML not requested",
+                    confidence=0.95,
+                    start_time=start_time
+                )
+
+            # Read and parse metadata
+            metadata = fast_json.loads(Path(metadata_path).read_bytes())
+
+            # Generate HTML report, streaming it straight to disk when saving
+            if output_path:
+                self._write_html_report(metadata, output_path)
+                html_content = None
+            else:
+                html_content = self._generate_html_report(metadata)
+
+            result_data = {
+                "html_content": html_content,
+                "output_file": str(output_path) if output_path else None,
+                "report_sections": [
+                    "Summary",
+                    "Agent Execution Timeline",
+                    "Execution Flow Diagram",
+                    "Detailed Agent Results"
+                ],
+                "generation_metadata": {
+                    "generated_at": datetime.now().isoformat(),
+                    "metadata_processed": metadata_path
+                }
+            }
+
+            return self._create_result(
+                task.task_id,
+                success=True,
+                data=result_data,
+                reasoning="Successfully generated interactive HTML report with execution diagram",
+                confidence=0.95,
+                start_time=start_time
+            )
 
-        return html
+        except Exception as e:
+            return self._create_result(
+                task.task_id,
+                success=False,
+                data={"error": str(e)},
+                reasoning=f"Error during HTML report generation: {str(e)}",
+                confidence=0.0,
+                start_time=start_time
+            )
 
-    def _generate_summary_section(self, metadata: Dict[str, Any]) -> str:
+    @classmethod
+    def render_many(
+        cls,
+        pairs: Iterable[Tuple[str, str]],
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """Render many reports in parallel, one worker process per CPU by default.
+
+        Each pair is ``(metadata_path, output_path)``. Reports are independent
+        and CPU-bound, so batch jobs scale across cores. Returns the output
+        paths in input order.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_render_one, pairs))
+
+    def _write_html_report(self, metadata: Dict[str, Any], output_path: str):
+        """Stream the report for metadata into output_path, creating parent directories."""
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+            self._generate_html_report(metadata, f)
+
+    def _generate_html_report(
+        self,
+        metadata: Dict[str, Any],
+        sink: Optional[TextIO] = None
+    ) -> Optional[str]:
+        """Generate the complete HTML report.
+
+        With a sink, the report is written to it section by section and None
+        is returned; otherwise the report is built in memory and returned.
+        """
+        if sink is None:
+            buf = io.StringIO()
+            self._generate_html_report(metadata, buf)
+            return buf.getvalue()
+
+        write = sink.write
+        views, successful_agents = self._build_agent_views(metadata.get("agent_results", {}))
+        # Sort agents once by execution order (using execution_time as proxy for start order)
+        sorted_views = sorted(views, key=attrgetter("execution_time"))
+
+        write(_HTML_HEAD)
+        write(self._generate_summary_section(metadata, len(views), successful_agents))
+        write(_HTML_BEFORE_TIMELINE)
+        self._write_timeline_section(sorted_views, write)
+        write(_HTML_BEFORE_DIAGRAM)
+        self._write_mermaid_diagram(sorted_views, write)
+        write(_HTML_BEFORE_DETAILS)
+        self._write_details_section(views, write)
+        write(_HTML_TAIL)
+        return None
+
+    def _build_agent_views(self, agent_results: Dict[str, Any]) -> Tuple[List[AgentView], int]:
+        """Pull the fields every report section needs out of each agent result once.
+
+        Returns the views and the number of successful agents.
+        """
+        views = []
+        successful_agents = 0
+        for agent_name, result in agent_results.items():
+            success = result.get("success", False)
+            if success:
+                successful_agents += 1
+            execution_time = result.get("execution_time", 0)
+            confidence = result.get("confidence", 0)
+            reasoning = result.get("reasoning", "No reasoning provided")
+            display_name = _display_name(agent_name)
+            row = {
+                "display_name": display_name,
+                "status_class": "success" if success else "failed",
+                "status_label": '✅ Success' if success else '❌ Failed',
+                "status_badge_class": 'status-completed' if success else 'status-failed',
+                "status_text": 'Success' if success else 'Failed',
+                "execution_time": f"{execution_time:.2f}",
+                "confidence": f"{confidence:.0%}",
+                "confidence_class": "confidence-high" if confidence >= 0.8 else "",
+                "model": html.escape(self._extract_model_info(result, agent_name), quote=False),
+                "reasoning": html.escape(reasoning, quote=False),
+                "reasoning_preview": html.escape(reasoning[:200], quote=False),
+                # Format data for display (limit size)
+                "data_str": html.escape(
+                    _truncated_json(result.get("data", {}), _DATA_PREVIEW_CHARS), quote=False
+                ),
+            }
+            views.append(AgentView(
+                name=agent_name,
+                success=success,
+                execution_time=execution_time,
+                display_name=display_name,
+                node_id=_node_id(agent_name),
+                row=row
+            ))
+        return views, successful_agents
+
+    def _generate_summary_section(
+        self,
+        metadata: Dict[str, Any],
+        total_agents: int,
+        successful_agents: int
+    ) -> str:
         """Generate the summary section of the report."""
 
         status = metadata.get("status", "unknown")
         total_time = metadata.get("processing_time", 0)
-        input_file = metadata.get("input_file", "Unknown")
-        output_dir = metadata.get("output_directory", "Unknown")
-        agent_results = metadata.get("agent_results", {})
-
-        # Count successful agents
-        successful_agents = sum(1 for result in agent_results.values()
-                               if result.get("success", False))
-        total_agents = len(agent_results)
+        input_file = html.escape(str(metadata.get("input_file", "Unknown")), quote=False)
+        output_dir = html.escape(str(metadata.get("output_directory", "Unknown")), quote=False)
 
         # Determine status class
         status_class = f"status-{status}" if status in ["completed", "failed"] else "status-unknown"
@@ -487,7 +775,7 @@ Always create well-structured, accessible HTML with modern design principles."""
             <div class="section">
                 <h2 class="section-title">📊 Processing Summary</h2>
                 <div style="margin-bottom: 20px;">
-                    <span class="status-badge {status_class}">{status.upper()}</span>
+                    <span class="status-badge {status_class}">{html.escape(status.upper(), quote=False)}</span>
                 </div>
 
                 <div class="metrics">
@@ -512,187 +800,71 @@ Always create well-structured, accessible HTML with modern design principles."""
                 <div style="margin-top: 20px; padding: 20px; background: #f9fafb; border-radius: 8px;">
                     <p><strong>Input File:</strong> {input_file}</p>
                     <p><strong>Output Directory:</strong> {output_dir}</p>
-                    <p><strong>Processing Started:</strong> {datetime.fromtimestamp(metadata.get('processing_start', 0)).strftime('%Y-%m-%d %H:%M:%S')}</p>
+                    <p><strong>Processing Started:</strong> {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(metadata.get('processing_start', 0)))}</p>
                 </div>
             </div>
         """
 
-    def _generate_timeline_section(self, agent_results: Dict[str, Any]) -> str:
-        """Generate the timeline section showing agent execution order."""
+    def _write_timeline_section(self, sorted_views: List[AgentView], write: Callable[[str], Any]):
+        """Write the timeline section showing agent execution order."""
 
-        # Sort agents by execution order (using execution_time as proxy for start order)
-        sorted_agents = sorted(
-            agent_results.items(),
-            key=lambda x: x[1].get("execution_time", 0)
-        )
+        write(_TIMELINE_HEADER)
+        for view in sorted_views:
+            write(_TIMELINE_ITEM_FMT.format_map(view.row))
+        write(_TIMELINE_FOOTER)
 
-        timeline_items = []
-        for agent_name, result in sorted_agents:
-            success = result.get("success", False)
-            execution_time = result.get("execution_time", 0)
-            reasoning = result.get("reasoning", "No reasoning provided")
-            confidence = result.get("confidence", 0)
-
-            # Extract model information
-            model = self._extract_model_info(result, agent_name)
+    def _write_mermaid_diagram(self, sorted_views: List[AgentView], write: Callable[[str], Any]):
+        """Write Mermaid diagram showing agent execution flow."""
+        write("\n".join(self._mermaid_lines(sorted_views)))
 
-            status_class = "success" if success else "failed"
-
-            timeline_items.append(f"""
-                <div class="timeline-item {status_class}">
-                    <div class="timeline-header">
-                        <div class="agent-name">
-                            {agent_name.replace('_', ' ').title()}
-                        </div>
-                        <div class="execution-time">
-                            ⏱️ {execution_time:.2f}s
-                        </div>
-                    </div>
-                    <p><strong>Status:</strong> {'✅ Success' if success else '❌ Failed'}</p>
-                    <p><strong>Confidence:</strong> {confidence:.0%}</p>
-                    <p><strong>Model:</strong> {model}</p>
-                    <p style="margin-top: 10px; color: #6b7280;">{reasoning[:200]}...</p>
-                </div>
-            """)
-
-        return f"""
-            <div class="section">
-                <h2 class="section-title">⏱️ Execution Timeline</h2>
-                <div class="timeline">
-                    {''.join(timeline_items)}
-                </div>
-            </div>
-        """
-
-    def _generate_mermaid_diagram(self, agent_results: Dict[str, Any]) -> str:
-        """Generate Mermaid diagram showing agent execution flow."""
-
-        # Sort agents by execution order
-        sorted_agents = sorted(
-            agent_results.items(),
-            key=lambda x: x[1].get("execution_time", 0)
-        )
-
-        # Build Mermaid flowchart
-        diagram_lines = ["graph TD"]
-        diagram_lines.append("    Start([FOIA Request Input]) --> Coordinator")
+    def _mermaid_lines(self, sorted_views: List[AgentView]) -> Iterator[str]:
+        """Yield the lines of the Mermaid flowchart."""
+        yield "graph TD"
+        yield "    Start([FOIA Request Input]) --> Coordinator"
 
         previous_node = "Coordinator"
 
-        for i, (agent_name, result) in enumerate(sorted_agents):
-            if agent_name == "coordinator":
-                # Style coordinator
-                success = result.get("success", False)
-                style = "fill:#667eea,stroke:#764ba2,stroke-width:3px,color:#fff"
-                diagram_lines.append(f"    Coordinator[Coordinator Agent]")
-                diagram_lines.append(f"    style Coordinator {style}")
+        for view in sorted_views:
+            if view.name == "coordinator":
+                yield "    Coordinator[Coordinator Agent]"
+                yield f"    style Coordinator {_COORD_STYLE}"
                 continue
 
-            # Create node name
-            node_id = agent_name.replace('_', '')
-            display_name = agent_name.replace('_', ' ').title()
-            success = result.get("success", False)
+            # Add node connection, styled by success
+            yield f"    {previous_node} --> {view.node_id}[{view.display_name}]"
+            yield f"    style {view.node_id} {_SUCCESS_STYLE if view.success else _FAIL_STYLE}"
 
-            # Determine node shape and style based on success
-            if success:
-                node_shape_start = "["
-                node_shape_end = "]"
-                style = "fill:#10b981,stroke:#059669,stroke-width:2px,color:#fff"
-            else:
-                node_shape_start = "["
-                node_shape_end = "]"
-                style = "fill:#ef4444,stroke:#dc2626,stroke-width:2px,color:#fff"
-
-            # Add node connection
-            diagram_lines.append(f"    {previous_node} --> {node_id}{node_shape_start}{display_name}{node_shape_end}")
-            diagram_lines.append(f"    style {node_id} {style}")
-
-            previous_node = node_id
+            previous_node = view.node_id
 
         # Add final node
-        diagram_lines.append(f"    {previous_node} --> End([Report Generated])")
-        diagram_lines.append(f"    style End fill:#764ba2,stroke:#667eea,stroke-width:3px,color:#fff")
-
-        return "\n".join(diagram_lines)
+        yield f"    {previous_node} --> End([Report Generated])"
+        yield f"    style End {_END_STYLE}"
 
     def _extract_model_info(self, result: Dict[str, Any], agent_name: str) -> str:
         """Extract model information from agent result."""
         data = result.get("data", {})
 
         # Check for generation_metadata with model_used
-        if "generation_metadata" in data:
-            model = data["generation_metadata"].get("model_used", "")
-            if model:
-                return model
+        generation_metadata = data.get("generation_metadata") if isinstance(data, dict) else None
+        if isinstance(generation_metadata, dict) and generation_metadata.get("model_used"):
+            return generation_metadata["model_used"]
 
         # Fallback based on agent type
-        model_map = {
-            "coordinator": "nvidia/nvidia-nemotron-nano-9b-v2",
-            "local_pdf_search": "nvidia/nvidia-nemotron-nano-9b-v2",
-            "pdf_parser": "nvidia/nemotron-nano-12b-v2-vl",
-            "document_researcher": "nvidia/nvidia-nemotron-nano-9b-v2",
-            "public_foia_search": "nvidia/nvidia-nemotron-nano-9b-v2",
-            "report_generator": "nvidia/nvidia-nemotron-nano-9b-v2",
-            "html_report_generator": "Direct Processing (Non-LLM)"
-        }
+        return _MODEL_MAP.get(agent_name, _DEFAULT_MODEL)
 
-        return model_map.get(agent_name, "nvidia/nvidia-nemotron-nano-9b-v2")
+    def _write_details_section(self, views: List[AgentView], write: Callable[[str], Any]):
+        """Write detailed results section for each agent."""
 
-    def _generate_details_section(self, agent_results: Dict[str, Any]) -> str:
-        """Generate detailed results section for each agent."""
+        write(_DETAILS_HEADER)
+        for view in views:
+            write(_DETAILS_CARD_FMT.format_map(view.row))
+        write(_DETAILS_FOOTER)
 
-        agent_cards = []
 
-        for agent_name, result in agent_results.items():
-            success = result.get("success", False)
-            confidence = result.get("confidence", 0)
-            execution_time = result.get("execution_time", 0)
-            reasoning = result.get("reasoning", "No reasoning provided")
-            data = result.get("data", {})
-
-            # Extract model information
-            model = self._extract_model_info(result, agent_name)
-
-            # Determine confidence badge class
-            confidence_class = "confidence-high" if confidence >= 0.8 else ""
-
-            # Format data for display (limit size)
-            data_str = json.dumps(data, indent=2, default=str)
-            if len(data_str) > 2000:
-                data_str = data_str[:2000] + "\n... (truncated)"
-
-            agent_cards.append(f"""
-                <div class="agent-card">
-                    <div class="agent-card-header">
-                        <h3>{agent_name.replace('_', ' ').title()}</h3>
-                        <div>
-                            <span class="status-badge {'status-completed' if success else 'status-failed'}">
-                                {'Success' if success else 'Failed'}
-                            </span>
-                            <span class="confidence-badge {confidence_class}">
-                                Confidence: {confidence:.0%}
-                            </span>
-                        </div>
-                    </div>
-
-                    <p><strong>Execution Time:</strong> {execution_time:.2f} seconds</p>
-                    <p><strong>Model Used:</strong> <code style="background: #f3f4f6; padding: 2px 6px; border-radius: 4px;">{model}</code></p>
-
-                    <div class="reasoning-box">
-                        <h4>🧠 Agent Reasoning</h4>
-                        <p>{reasoning}</p>
-                    </div>
-
-                    <div class="data-section">
-                        <h4>📦 Result Data</h4>
-                        <pre>{data_str}</pre>
-                    </div>
-                </div>
-            """)
-
-        return f"""
-            <div class="section agent-details">
-                <h2 class="section-title">🔍 Detailed Agent Results</h2>
-                {''.join(agent_cards)}
-            </div>
-        """
+def _render_one(paths: Tuple[str, str]) -> str:
+    """Render one report in a worker process for ``render_many``."""
+    metadata_path, output_path = paths
+    # Rendering never calls the model, so no client is needed
+    agent = HTMLReportGeneratorAgent(nvidia_client=None)
+    agent._write_html_report(fast_json.loads(Path(metadata_path).read_bytes()), output_path)
+    return output_path
@@ -1,251 +1,84 @@
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO, Optional
+import hashlib
+import io
 import json
+import os
+import shutil
+import threading
 import time
 import webbrowser
 from datetime import datetime
 from pathlib import Path
 from .base import BaseAgent
 from ..models import AgentResult, TaskMessage
+from ..utils import fast_json
+from ..utils.minify import minify_css, minify_js
 
+try:
+    import markdown_it
+    from markdown_it import MarkdownIt
+except ImportError:  # markdown-it-py is optional; markdown is then rendered in the browser
+    markdown_it = None
+    MarkdownIt = None
 
-class InteractiveUIGeneratorAgent(BaseAgent):
-    """Generates an interactive tabbed UI with FOIA request, final report, and processing details."""
-
-    def __init__(self, nvidia_client):
-        super().__init__(
-            name="interactive_ui_generator",
-            description="Creates interactive tabbed UI for comprehensive FOIA processing visualization",
-            nvidia_client=nvidia_client
-        )
-        self.add_capability("ui_generation")
-        self.add_capability("markdown_rendering")
-        self.add_capability("interactive_visualization")
-
-    def get_system_prompt(self) -> str:
-        return """You are the Interactive UI Generator Agent for FOIA-Buddy.
-
-Your role is to:
-1. CREATE a tabbed interface with FOIA request, final report, and processing workflow
-2. RENDER markdown content beautifully with syntax highlighting
-3. PROVIDE an intuitive, professional user experience
-4. AUTO-OPEN the interface in the default browser when processing completes
-
-Interface Requirements:
-- Modern tabbed navigation (FOIA Request | Final Report | Processing Workflow)
-- Beautiful markdown rendering with GitHub-flavored markdown support
-- Responsive design that works on all screen sizes
-- Smooth transitions and professional aesthetics
-- Integration with existing processing_report.html via iframe/embed"""
-
-    async def execute(self, task: TaskMessage) -> AgentResult:
-        """Execute interactive UI generation task."""
-        start_time = time.time()
-
-        try:
-            # Get paths from task context
-            output_dir = Path(task.context.get("output_dir", ""))
-            input_file = task.context.get("input_file", "")
-            auto_open = task.context.get("auto_open", True)
-
-            if not output_dir.exists():
-                return self._create_result(
-                    task.task_id,
-                    success=False,
-                    data={"error": f"Output directory not found: {output_dir}"},
-                    reasoning="Cannot generate UI without valid output directory",
-                    confidence=0.0,
-                    start_time=start_time
-                )
-
-            # Read source files
-            foia_request_content = self._read_file(input_file)
-            final_report_content = self._read_file(output_dir / "final_report.md")
-            processing_report_path = output_dir / "processing_report.html"
-            metadata_path = output_dir / "processing_metadata.json"
-
-            # Check if processing report exists and read metadata
-            has_processing_report = processing_report_path.exists()
-            processing_metadata = {}
-            if metadata_path.exists():
-                try:
-                    with open(metadata_path, 'r', encoding='utf-8') as f:
-                        processing_metadata = json.load(f)
-                except:
-                    pass
-
-            # Generate interactive UI HTML
-            html_content = self._generate_interactive_ui(
-                foia_request_content,
-                final_report_content,
-                has_processing_report,
-                processing_metadata
-            )
-
-            # Save interactive UI
-            ui_output_path = output_dir / "interactive_viewer.html"
-            with open(ui_output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            # Auto-open in browser if requested
-            if auto_open:
-                try:
-                    webbrowser.open(f"file://{ui_output_path.absolute()}")
-                except Exception as e:
-                    # Non-critical error - just log it
-                    pass
-
-            result_data = {
-                "ui_file": str(ui_output_path),
-                "auto_opened": auto_open,
-                "tabs_generated": [
-                    "FOIA Request",
-                    "Final Report",
-                    "Processing Workflow" if has_processing_report else None
-                ],
-                "generation_metadata": {
-                    "generated_at": datetime.now().isoformat(),
-                    "output_directory": str(output_dir)
-                }
-            }
-
-            return self._create_result(
-                task.task_id,
-                success=True,
-                data=result_data,
-                reasoning="Successfully generated interactive tabbed UI and opened in browser",
-                confidence=0.95,
-                start_time=start_time
-            )
-
-        except Exception as e:
-            return self._create_result(
-                task.task_id,
-                success=False,
-                data={"error": str(e)},
-                reasoning=f"Error during interactive UI generation: {str(e)}",
-                confidence=0.0,
-                start_time=start_time
-            )
-
-    def _read_file(self, file_path) -> str:
-        """Read file content safely."""
-        try:
-            path = Path(file_path)
-            if path.exists():
-                with open(path, 'r', encoding='utf-8') as f:
-                    return f.read()
-        except Exception:
-            pass
-        return "# Content Not Available\n\nThe requested content could not be loaded."
-
-    def _generate_interactive_ui(
-        self,
-        foia_request: str,
-        final_report: str,
-        has_processing_report: bool,
-        processing_metadata: Dict[str, Any]
-    ) -> str:
-        """Generate the interactive tabbed UI HTML."""
-
-        # Escape content for safe embedding
-        foia_request_safe = self._escape_for_js(foia_request)
-        final_report_safe = self._escape_for_js(final_report)
-
-        # Generate workflow HTML content from metadata
-        workflow_html = self._generate_workflow_html(processing_metadata) if has_processing_report else ""
-
-        # Generate tab buttons HTML
-        tabs_html = """
-            <button class="tab-button active" onclick="openTab(event, 'foia-request')">
-                📄 FOIA Request
-            </button>
-            <button class="tab-button" onclick="openTab(event, 'final-report')">
-                📋 Final Report
-            </button>
-        """
-
-        if has_processing_report:
-            tabs_html += """
-            <button class="tab-button" onclick="openTab(event, 'processing-workflow')">
-                🔄 Processing Workflow
-            </button>
-            """
-
-        # Generate tab content HTML
-        workflow_tab = ""
-        if has_processing_report:
-            workflow_tab = f"""
-            <div id="processing-workflow" class="tab-content">
-                <div class="workflow-container">
-                    {workflow_html}
-                </div>
-            </div>
-            """
 
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>FOIA-Buddy Interactive Viewer</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/github-markdown-css/5.5.0/github-markdown.min.css">
-    <script src="https://cdn.jsdelivr.net/npm/marked@11.0.0/marked.min.js"></script>
-    <style>
-        * {{
+# Static viewer stylesheet
+_STATIC_CSS = """\
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             background: #0f172a;
             color: #e2e8f0;
             height: 100vh;
             overflow: hidden;
-        }}
+        }
 
-        .app-container {{
+        .app-container {
             display: flex;
             flex-direction: column;
             height: 100vh;
-        }}
+        }
 
-        .header {{
+        .header {
             background: linear-gradient(135deg, #10b981 0%, #059669 50%, #047857 100%);
             color: white;
             padding: 20px 40px;
             box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
             z-index: 10;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             font-size: 2em;
             font-weight: 700;
             margin-bottom: 5px;
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
+        }
 
-        .header p {{
+        .header p {
             font-size: 1em;
             opacity: 0.95;
-        }}
+        }
 
-        .header .logo {{
+        .header .logo {
             font-size: 1.5em;
-        }}
+        }
 
-        .tab-container {{
+        .tab-container {
             background: #1e293b;
             border-bottom: 2px solid #334155;
             display: flex;
             padding: 0 40px;
             gap: 5px;
-        }}
+        }
 
-        .tab-button {{
+        .tab-button {
             background: transparent;
             border: none;
             color: #94a3b8;
@@ -258,38 +91,38 @@ Interface Requirements:
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .tab-button:hover {{
+        .tab-button:hover {
             background: #334155;
             color: #e2e8f0;
-        }}
+        }
 
-        .tab-button.active {{
+        .tab-button.active {
             color: #10b981;
             border-bottom-color: #10b981;
             background: #0f172a;
-        }}
+        }
 
-        .content-container {{
+        .content-container {
             flex: 1;
             overflow: hidden;
             position: relative;
-        }}
+        }
 
-        .tab-content {{
+        .tab-content {
             display: none;
             height: 100%;
             overflow-y: auto;
             background: #0f172a;
             padding: 40px;
-        }}
+        }
 
-        .tab-content.active {{
+        .tab-content.active {
             display: block;
-        }}
+        }
 
-        .markdown-body {{
+        .markdown-body {
             background: #1e293b;
             color: #e2e8f0;
             padding: 40px;
@@ -297,179 +130,179 @@ Interface Requirements:
             box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.3);
             max-width: 1000px;
             margin: 0 auto;
-        }}
+        }
 
         .markdown-body h1,
         .markdown-body h2,
         .markdown-body h3,
         .markdown-body h4,
         .markdown-body h5,
-        .markdown-body h6 {{
+        .markdown-body h6 {
             color: #f1f5f9;
             border-bottom-color: #334155;
             margin-top: 24px;
             margin-bottom: 16px;
-        }}
+        }
 
-        .markdown-body h1 {{
+        .markdown-body h1 {
             color: #10b981;
             font-size: 2.5em;
-        }}
+        }
 
-        .markdown-body h2 {{
+        .markdown-body h2 {
             color: #34d399;
             font-size: 2em;
-        }}
+        }
 
-        .markdown-body a {{
+        .markdown-body a {
             color: #10b981;
-        }}
+        }
 
-        .markdown-body a:hover {{
+        .markdown-body a:hover {
             color: #34d399;
-        }}
+        }
 
-        .markdown-body code {{
+        .markdown-body code {
             background: #0f172a;
             color: #fbbf24;
             padding: 2px 6px;
             border-radius: 4px;
             font-family: 'Monaco', 'Menlo', 'Consolas', monospace;
-        }}
+        }
 
-        .markdown-body pre {{
+        .markdown-body pre {
             background: #0f172a;
             border: 1px solid #334155;
-        }}
+        }
 
-        .markdown-body pre code {{
+        .markdown-body pre code {
             color: #e2e8f0;
-        }}
+        }
 
-        .markdown-body blockquote {{
+        .markdown-body blockquote {
             color: #cbd5e1;
             border-left-color: #10b981;
             background: #1e293b;
-        }}
+        }
 
-        .markdown-body table tr {{
+        .markdown-body table tr {
             background: #1e293b;
             border-top-color: #334155;
-        }}
+        }
 
-        .markdown-body table tr:nth-child(2n) {{
+        .markdown-body table tr:nth-child(2n) {
             background: #0f172a;
-        }}
+        }
 
         .markdown-body table th,
-        .markdown-body table td {{
+        .markdown-body table td {
             border-color: #334155;
-        }}
+        }
 
-        .markdown-body hr {{
+        .markdown-body hr {
             background-color: #334155;
             border: none;
             height: 2px;
-        }}
+        }
 
-        .markdown-body ul li::marker {{
+        .markdown-body ul li::marker {
             color: #10b981;
-        }}
+        }
 
-        .markdown-body strong {{
+        .markdown-body strong {
             color: #f1f5f9;
-        }}
+        }
 
         /* Custom scrollbar */
-        ::-webkit-scrollbar {{
+        ::-webkit-scrollbar {
             width: 12px;
-        }}
+        }
 
-        ::-webkit-scrollbar-track {{
+        ::-webkit-scrollbar-track {
             background: #1e293b;
-        }}
+        }
 
-        ::-webkit-scrollbar-thumb {{
+        ::-webkit-scrollbar-thumb {
             background: #475569;
             border-radius: 6px;
-        }}
+        }
 
-        ::-webkit-scrollbar-thumb:hover {{
+        ::-webkit-scrollbar-thumb:hover {
             background: #64748b;
-        }}
+        }
 
         /* Loading animation */
-        .loading {{
+        .loading {
             display: flex;
             justify-content: center;
             align-items: center;
             height: 200px;
             color: #94a3b8;
             font-size: 1.2em;
-        }}
+        }
 
         /* Workflow container styles */
-        .workflow-container {{
+        .workflow-container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
+        }
 
-        .workflow-section {{
+        .workflow-section {
             background: #1e293b;
             padding: 30px;
             border-radius: 12px;
             margin-bottom: 30px;
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }}
+        }
 
-        .workflow-section h2 {{
+        .workflow-section h2 {
             color: #10b981;
             font-size: 1.8em;
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 3px solid #10b981;
-        }}
+        }
 
-        .workflow-section h3 {{
+        .workflow-section h3 {
             color: #34d399;
             font-size: 1.3em;
             margin-top: 20px;
             margin-bottom: 15px;
-        }}
+        }
 
-        .metric-grid {{
+        .metric-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin: 20px 0;
-        }}
+        }
 
-        .metric-box {{
+        .metric-box {
             background: linear-gradient(135deg, #10b981 0%, #059669 100%);
             color: white;
             padding: 20px;
             border-radius: 10px;
             text-align: center;
-        }}
+        }
 
-        .metric-box .label {{
+        .metric-box .label {
             font-size: 0.9em;
             opacity: 0.9;
             margin-bottom: 8px;
-        }}
+        }
 
-        .metric-box .value {{
+        .metric-box .value {
             font-size: 2em;
             font-weight: 700;
-        }}
+        }
 
-        .agent-timeline {{
+        .agent-timeline {
             position: relative;
             padding-left: 30px;
             margin: 20px 0;
-        }}
+        }
 
-        .agent-timeline::before {{
+        .agent-timeline::before {
             content: '';
             position: absolute;
             left: 10px;
@@ -477,18 +310,18 @@ Interface Requirements:
             bottom: 0;
             width: 3px;
             background: #10b981;
-        }}
+        }
 
-        .agent-item {{
+        .agent-item {
             position: relative;
             margin-bottom: 25px;
             padding: 15px 20px;
             background: #0f172a;
             border-radius: 8px;
             border-left: 4px solid #10b981;
-        }}
+        }
 
-        .agent-item::before {{
+        .agent-item::before {
             content: '';
             position: absolute;
             left: -37px;
@@ -498,85 +331,101 @@ Interface Requirements:
             border-radius: 50%;
             background: #10b981;
             border: 3px solid #1e293b;
-        }}
+        }
 
-        .agent-item.success::before {{
+        .agent-item.success::before {
             background: #10b981;
-        }}
+        }
 
-        .agent-item.failed::before {{
+        .agent-item.failed::before {
             background: #ef4444;
-        }}
+        }
 
-        .agent-name {{
+        .agent-name {
             font-size: 1.2em;
             font-weight: 600;
             color: #10b981;
             margin-bottom: 8px;
-        }}
+        }
 
-        .agent-details {{
+        .agent-details {
             font-size: 0.9em;
             color: #94a3b8;
             line-height: 1.6;
-        }}
+        }
 
-        .status-badge {{
+        .status-badge {
             display: inline-block;
             padding: 4px 12px;
             border-radius: 12px;
             font-size: 0.85em;
             font-weight: 600;
             margin-left: 10px;
-        }}
+        }
 
-        .status-success {{
+        .status-success {
             background: #10b981;
             color: white;
-        }}
+        }
 
-        .status-failed {{
+        .status-failed {
             background: #ef4444;
             color: white;
-        }}
+        }
 
         /* Responsive design */
-        @media (max-width: 768px) {{
-            .header {{
+        @media (max-width: 768px) {
+            .header {
                 padding: 15px 20px;
-            }}
+            }
 
-            .header h1 {{
+            .header h1 {
                 font-size: 1.5em;
-            }}
+            }
 
-            .tab-container {{
+            .tab-container {
                 padding: 0 20px;
                 overflow-x: auto;
-            }}
+            }
 
-            .tab-button {{
+            .tab-button {
                 padding: 12px 20px;
                 font-size: 0.9em;
                 white-space: nowrap;
-            }}
+            }
 
-            .tab-content {{
+            .tab-content {
                 padding: 20px;
-            }}
+            }
 
-            .markdown-body {{
+            .markdown-body {
                 padding: 20px;
-            }}
+            }
 
-            .workflow-section {{
+            .workflow-section {
                 padding: 20px;
-            }}
+            }
 
-            .metric-grid {{
+            .metric-grid {
                 grid-template-columns: 1fr;
-            }}
-        }}
+            }
+        }
+"""
+
+# Static page fragments are pre-encoded UTF-8, so a render only encodes the
+# dynamic parts of the page
+
+# Page chrome up to the tab buttons
+_MARKED_SCRIPT_TAG = '    <script src="https://cdn.jsdelivr.net/npm/marked@11.0.0/marked.min.js"></script>\n'
+_HTML_HEAD = ("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>FOIA-Buddy Interactive Viewer</title>
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/github-markdown-css/5.5.0/github-markdown.min.css">
+""" + _MARKED_SCRIPT_TAG + """    <style>
+""" + minify_css(_STATIC_CSS) + """
     </style>
 </head>
 <body>
@@ -587,123 +436,204 @@ Interface Requirements:
         </div>
 
         <div class="tab-container">
-            {tabs_html}
+            """).encode("utf-8")
+
+# Without the client-side renderer when markdown is rendered in Python
+_HTML_HEAD_PRERENDERED = _HTML_HEAD.replace(_MARKED_SCRIPT_TAG.encode("utf-8"), b"", 1)
+
+_TAB_BUTTONS = """
+            <button class="tab-button active" onclick="openTab(event, 'foia-request')">
+                📄 FOIA Request
+            </button>
+            <button class="tab-button" onclick="openTab(event, 'final-report')">
+                📋 Final Report
+            </button>
+        """.encode("utf-8")
+
+_WORKFLOW_TAB_BUTTON = """
+            <button class="tab-button" onclick="openTab(event, 'processing-workflow')">
+                🔄 Processing Workflow
+            </button>
+            """.encode("utf-8")
+
+# Tab panes for the two markdown documents, split around their contents:
+# rendered HTML, or a loading placeholder until the client renders them
+_PANES_HEAD = """
         </div>
 
         <div class="content-container">
             <div id="foia-request" class="tab-content active">
-                <div class="markdown-body" id="foia-request-content">
-                    <div class="loading">Loading FOIA Request...</div>
-                </div>
+                <div class="markdown-body" id="foia-request-content">""".encode("utf-8")
+
+_PANES_BETWEEN = """</div>
             </div>
 
             <div id="final-report" class="tab-content">
-                <div class="markdown-body" id="final-report-content">
+                <div class="markdown-body" id="final-report-content">""".encode("utf-8")
+
+_PANES_TAIL = """</div>
+            </div>
+
+            """.encode("utf-8")
+
+_FOIA_REQUEST_LOADING = """
+                    <div class="loading">Loading FOIA Request...</div>
+                """.encode("utf-8")
+
+_FINAL_REPORT_LOADING = """
                     <div class="loading">Loading Final Report...</div>
+                """.encode("utf-8")
+
+_WORKFLOW_TAB_FMT = """
+            <div id="processing-workflow" class="tab-content">
+                <div class="workflow-container">
+                    {workflow_html}
                 </div>
             </div>
+            """
 
-            {workflow_tab}
+_HTML_CONTENT_CLOSE = """
         </div>
     </div>
+""".encode("utf-8")
+
+# Markdown documents as JSON data blocks for client-side rendering
+_MARKDOWN_DATA_HEAD = """
+    <script type="application/json" id="foia-request-markdown">""".encode("utf-8")
+
+_MARKDOWN_DATA_BETWEEN = """</script>
+    <script type="application/json" id="final-report-markdown">""".encode("utf-8")
 
+_MARKDOWN_DATA_TAIL = """</script>
+""".encode("utf-8")
+
+# Empty data blocks pointing at the markdown files next to the viewer, which
+# the client script fetches instead
+_MARKDOWN_LINKS = """
+    <script type="application/json" id="foia-request-markdown" data-src="foia_request.md"></script>
+    <script type="application/json" id="final-report-markdown" data-src="final_report.md"></script>
+""".encode("utf-8")
+
+# Client script. The tail has one variant per set of tabs.
+_SCRIPT_BEFORE_TABS = """
     <script>
-        // Configure marked for GitHub-flavored markdown
-        marked.setOptions({{
-            breaks: true,
-            gfm: true,
-            headerIds: true,
-            mangle: false
-        }});
-
-        // Content data
-        const foiaRequestMarkdown = `{foia_request_safe}`;
-        const finalReportMarkdown = `{final_report_safe}`;
-
-        // Render markdown content
-        document.addEventListener('DOMContentLoaded', function() {{
-            const foiaContent = document.getElementById('foia-request-content');
-            const reportContent = document.getElementById('final-report-content');
-
-            try {{
-                foiaContent.innerHTML = marked.parse(foiaRequestMarkdown);
-            }} catch (e) {{
-                foiaContent.innerHTML = '<p style="color: #ef4444;">Error rendering FOIA request content.</p>';
-            }}
-
-            try {{
-                reportContent.innerHTML = marked.parse(finalReportMarkdown);
-            }} catch (e) {{
-                reportContent.innerHTML = '<p style="color: #ef4444;">Error rendering final report content.</p>';
-            }}
-        }});
+        // Configure marked for GitHub-flavored markdown, unless the markdown
+        // was rendered ahead of time and marked is not loaded
+        if (typeof marked !== 'undefined') {
+            marked.setOptions({
+                breaks: true,
+                gfm: true,
+                headerIds: true,
+                mangle: false
+            });
+        }
+
+        // Markdown tabs, parsed and rendered the first time they are shown
+        const markdownTabs = {
+            'foia-request': {
+                dataId: 'foia-request-markdown',
+                contentId: 'foia-request-content',
+                error: 'Error rendering FOIA request content.'
+            },
+            'final-report': {
+                dataId: 'final-report-markdown',
+                contentId: 'final-report-content',
+                error: 'Error rendering final report content.'
+            }
+        };
+
+        function renderTab(tabName) {
+            const tab = markdownTabs[tabName];
+            const data = tab && document.getElementById(tab.dataId);
+            if (!data || tab.rendered) {
+                return;
+            }
+            tab.rendered = true;
+
+            // The markdown is embedded as JSON, or fetched from the file named by data-src
+            const content = document.getElementById(tab.contentId);
+            const markdown = data.dataset.src
+                ? fetch(data.dataset.src).then(function(response) {
+                    if (!response.ok) {
+                        throw new Error(response.statusText);
+                    }
+                    return response.text();
+                })
+                : Promise.resolve().then(function() {
+                    return JSON.parse(data.textContent);
+                });
+            markdown.then(function(text) {
+                content.innerHTML = marked.parse(text);
+            }).catch(function() {
+                content.innerHTML = '<p style="color: #ef4444;">' + tab.error + '</p>';
+            });
+        }
+
+        // Render the active tab now and the final report once the browser is idle
+        document.addEventListener('DOMContentLoaded', function() {
+            renderTab('foia-request');
+            if ('requestIdleCallback' in window) {
+                requestIdleCallback(function() {
+                    renderTab('final-report');
+                });
+            }
+        });
 
         // Tab switching function
-        function openTab(evt, tabName) {{
+        function openTab(evt, tabName) {
             // Hide all tab contents
             const tabContents = document.getElementsByClassName('tab-content');
-            for (let i = 0; i < tabContents.length; i++) {{
+            for (let i = 0; i < tabContents.length; i++) {
                 tabContents[i].classList.remove('active');
-            }}
+            }
 
             // Remove active class from all buttons
             const tabButtons = document.getElementsByClassName('tab-button');
-            for (let i = 0; i < tabButtons.length; i++) {{
+            for (let i = 0; i < tabButtons.length; i++) {
                 tabButtons[i].classList.remove('active');
-            }}
+            }
 
             // Show the selected tab
+            renderTab(tabName);
             document.getElementById(tabName).classList.add('active');
             evt.currentTarget.classList.add('active');
-        }}
+        }
 
         // Keyboard navigation
-        document.addEventListener('keydown', function(e) {{
-            if (e.ctrlKey || e.metaKey) {{
-                const tabs = ['foia-request', 'final-report', {'processing-workflow' if has_processing_report else 'null'}].filter(t => t !== null);
+        document.addEventListener('keydown', function(e) {
+            if (e.ctrlKey || e.metaKey) {
+                """
+
+_SCRIPT_AFTER_TABS = """
                 const buttons = document.querySelectorAll('.tab-button');
 
-                if (e.key === '1' && tabs[0]) {{
+                if (e.key === '1' && tabs[0]) {
                     buttons[0].click();
-                }} else if (e.key === '2' && tabs[1]) {{
+                } else if (e.key === '2' && tabs[1]) {
                     buttons[1].click();
-                }} else if (e.key === '3' && tabs[2]) {{
+                } else if (e.key === '3' && tabs[2]) {
                     buttons[2].click();
-                }}
-            }}
-        }});
+                }
+            }
+        });
     </script>
 </body>
 </html>"""
 
-        return html
-
-    def _escape_for_js(self, content: str) -> str:
-        """Escape content for safe JavaScript embedding."""
-        # Replace backticks and backslashes
-        content = content.replace('\\', '\\\\')
-        content = content.replace('`', '\\`')
-        content = content.replace('${', '\\${')
-        return content
-
-    def _generate_workflow_html(self, metadata: Dict[str, Any]) -> str:
-        """Generate workflow HTML content from processing metadata."""
-        if not metadata:
-            return "<p>No processing metadata available.</p>"
-
-        # Extract key information
-        agent_results = metadata.get("agent_results", {})
-        status = metadata.get("status", "unknown")
-        total_time = metadata.get("processing_time", 0)
-        input_file = metadata.get("input_file", "Unknown")
-        output_dir = metadata.get("output_directory", "Unknown")
+# Keyboard shortcuts only cover the tabs that exist. Both variants are
+# minified once here.
+_SCRIPT_TAIL_WITH_WORKFLOW = minify_js(
+    _SCRIPT_BEFORE_TABS
+    + "const tabs = ['foia-request', 'final-report', 'processing-workflow'];"
+    + _SCRIPT_AFTER_TABS
+).encode("utf-8")
+_SCRIPT_TAIL_NO_WORKFLOW = minify_js(
+    _SCRIPT_BEFORE_TABS + "const tabs = ['foia-request', 'final-report'];" + _SCRIPT_AFTER_TABS
+).encode("utf-8")
 
-        # Count successful agents
-        successful_agents = sum(1 for result in agent_results.values() if result.get("success", False))
-        total_agents = len(agent_results)
 
-        # Generate summary section
-        summary_html = f"""
+# Workflow tab sections, rendered per call with str.format_map
+_WORKFLOW_SUMMARY_FMT = """
         <div class="workflow-section">
             <h2>📊 Processing Summary</h2>
             <div class="metric-grid">
@@ -721,55 +651,446 @@ Interface Requirements:
                 </div>
                 <div class="metric-box">
                     <div class="label">Success Rate</div>
-                    <div class="value">{(successful_agents/max(total_agents,1)*100):.0f}%</div>
+                    <div class="value">{success_rate:.0f}%</div>
                 </div>
             </div>
             <p style="color: #94a3b8; margin-top: 20px;"><strong>Input:</strong> {input_file}</p>
             <p style="color: #94a3b8;"><strong>Output:</strong> {output_dir}</p>
-            <p style="color: #94a3b8;"><strong>Status:</strong> <span class="status-badge status-{'success' if status == 'completed' else 'failed'}">{status.upper()}</span></p>
+            <p style="color: #94a3b8;"><strong>Status:</strong> <span class="status-badge status-{status_class}">{status}</span></p>
         </div>
         """
 
-        # Generate agent timeline
-        timeline_items = []
-        for agent_name, result in agent_results.items():
-            success = result.get("success", False)
-            execution_time = result.get("execution_time", 0)
-            reasoning = result.get("reasoning", "No reasoning provided")
-            confidence = result.get("confidence", 0)
-
-            # Get model used
-            model = "Unknown"
-            if "data" in result and isinstance(result["data"], dict):
-                gen_meta = result["data"].get("generation_metadata", {})
-                if isinstance(gen_meta, dict):
-                    model = gen_meta.get("model_used", "Unknown")
+_WORKFLOW_TIMELINE_HEAD = """
+        <div class="workflow-section">
+            <h2>⏱️ Agent Execution Timeline</h2>
+            <div class="agent-timeline">
+                """
 
-            status_class = "success" if success else "failed"
-            status_text = "✅ Success" if success else "❌ Failed"
+_WORKFLOW_TIMELINE_TAIL = """
+            </div>
+        </div>
+        """
 
-            timeline_items.append(f"""
+# One agent in the workflow tab's execution timeline
+_AGENT_ITEM_FMT = """
             <div class="agent-item {status_class}">
                 <div class="agent-name">
-                    {agent_name.replace('_', ' ').title()}
+                    {display_name}
                     <span class="status-badge status-{status_class}">{status_text}</span>
                 </div>
                 <div class="agent-details">
                     <p><strong>Execution Time:</strong> {execution_time:.2f}s</p>
                     <p><strong>Confidence:</strong> {confidence:.0%}</p>
                     <p><strong>Model:</strong> {model}</p>
-                    <p style="margin-top: 10px; font-style: italic;">{reasoning[:200]}{'...' if len(reasoning) > 200 else ''}</p>
+                    <p style="margin-top: 10px; font-style: italic;">{reasoning}{ellipsis}</p>
                 </div>
             </div>
-            """)
+            """
 
-        timeline_html = f"""
-        <div class="workflow-section">
-            <h2>⏱️ Agent Execution Timeline</h2>
-            <div class="agent-timeline">
-                {''.join(timeline_items)}
-            </div>
-        </div>
+# Placeholder markdown shown when a source document cannot be read
+_CONTENT_NOT_AVAILABLE = "# Content Not Available\n\nThe requested content could not be loaded."
+
+# Rendered viewers are cached in this subdirectory of the output directory,
+# named by a hash of their inputs; the least recently used beyond the limit
+# are removed
+_UI_CACHE_DIR = ".ui_cache"
+_UI_CACHE_MAX_ENTRIES = 8
+
+# Every cache key starts from a digest of the static page fragments and the
+# markdown renderer version, so changing either invalidates earlier renders
+_TEMPLATE_DIGEST = hashlib.blake2b(
+    b'\0'.join(
+        fragment if isinstance(fragment, bytes) else fragment.encode('utf-8')
+        for fragment in (
+            _HTML_HEAD, _HTML_HEAD_PRERENDERED, _TAB_BUTTONS, _WORKFLOW_TAB_BUTTON,
+            _PANES_HEAD, _PANES_BETWEEN, _PANES_TAIL,
+            _FOIA_REQUEST_LOADING, _FINAL_REPORT_LOADING, _WORKFLOW_TAB_FMT,
+            _HTML_CONTENT_CLOSE, _MARKDOWN_DATA_HEAD, _MARKDOWN_DATA_BETWEEN,
+            _MARKDOWN_DATA_TAIL, _MARKDOWN_LINKS,
+            _SCRIPT_TAIL_WITH_WORKFLOW, _SCRIPT_TAIL_NO_WORKFLOW,
+            _WORKFLOW_SUMMARY_FMT, _WORKFLOW_TIMELINE_HEAD, _WORKFLOW_TIMELINE_TAIL,
+            _AGENT_ITEM_FMT, _CONTENT_NOT_AVAILABLE,
+            markdown_it.__version__ if markdown_it is not None else '',
+        )
+    ),
+    digest_size=16
+).digest()
+
+
+# The page is streamed in many small writes; a large buffer turns them into
+# a few syscalls
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+class InteractiveUIGeneratorAgent(BaseAgent):
+    """Generates an interactive tabbed UI with FOIA request, final report, and processing details."""
+
+    def __init__(self, nvidia_client):
+        super().__init__(
+            name="interactive_ui_generator",
+            description="Creates interactive tabbed UI for comprehensive FOIA processing visualization",
+            nvidia_client=nvidia_client
+        )
+        self.add_capability("ui_generation")
+        self.add_capability("markdown_rendering")
+        self.add_capability("interactive_visualization")
+
+        # Markdown is rendered once in Python when markdown-it-py is installed,
+        # and in the browser with marked otherwise. Raw HTML in the markdown is
+        # escaped, so request or report text cannot inject markup or scripts.
+        self._markdown = (
+            MarkdownIt("commonmark", {"html": False, "breaks": True}).enable(["table", "strikethrough"])
+            if MarkdownIt is not None else None
+        )
+
+    def get_system_prompt(self) -> str:
+        return """You are the Interactive UI Generator Agent for FOIA-Buddy.
+
+Your role is to:
+1. CREATE a tabbed interface with FOIA request, final report, and processing workflow
+2. RENDER markdown content beautifully with syntax highlighting
+3. PROVIDE an intuitive, professional user experience
+4. AUTO-OPEN the interface in the default browser when processing completes
+
+Interface Requirements:
+- Modern tabbed navigation (FOIA Request | Final Report | Processing Workflow)
+- Beautiful markdown rendering with GitHub-flavored markdown support
+- Responsive design that works on all screen sizes
+- Smooth transitions and professional aesthetics
+- Integration with existing processing_report.html via iframe/embed"""
+
+    async def execute(self, task: TaskMessage) -> AgentResult:
+        """Execute interactive UI generation task."""
+        start_time = time.perf_counter()
+
+        try:
+            # Get paths from task context
+            output_dir = Path(task.context.get("output_dir", ""))
+            input_file = task.context.get("input_file", "")
+            auto_open = task.context.get("auto_open", True)
+            embed_markdown = task.context.get("embed_markdown", True)
+
+            # List the output directory once instead of probing each file
+            try:
+                output_names = {entry.name for entry in os.scandir(output_dir)}
+            except OSError:
+                return self._create_result(
+                    task.task_id,
+                    success=False,
+                    data={"error": f"Output directory not found: {output_dir}"},
+                    reasoning="Cannot generate UI without valid output directory",
+                    confidence=0.0,
+                    start_time=start_time
+                )
+
+            # Read source files
+            foia_request_content = self._read_file(input_file)
+            final_report_content = self._read_file(output_dir / "final_report.md")
+            if not embed_markdown:
+                # The viewer fetches the request from next to itself
+                (output_dir / "foia_request.md").write_text(foia_request_content, encoding='utf-8')
+            metadata_path = output_dir / "processing_metadata.json"
+
+            # Check if processing report exists. The metadata only feeds the
+            # workflow tab, so it is not read without one.
+            has_processing_report = "processing_report.html" in output_names
+            processing_metadata = {}
+            metadata_bytes = b""
+            if has_processing_report and metadata_path.name in output_names:
+                try:
+                    metadata_bytes = metadata_path.read_bytes()
+                    processing_metadata = fast_json.loads(metadata_bytes)
+                except (OSError, json.JSONDecodeError):
+                    pass
+
+            # Reuse an earlier render of identical inputs; otherwise stream a new
+            # render straight to disk and keep it in the cache
+            ui_output_path = output_dir / "interactive_viewer.html"
+            cache_key = self._ui_cache_key(
+                foia_request_content,
+                final_report_content,
+                has_processing_report,
+                embed_markdown,
+                metadata_bytes
+            )
+            cache_path = output_dir / _UI_CACHE_DIR / f"{cache_key}.html"
+            cache_hit = cache_path.exists()
+            if cache_hit:
+                # Mark the entry as recently used. A copy, not a link, so the
+                # viewer gets a fresh mtime for the launcher.
+                os.utime(cache_path)
+                self._copy_file(cache_path, ui_output_path)
+            else:
+                partial_path = ui_output_path.with_name(ui_output_path.name + ".tmp")
+                with open(partial_path, 'wb', buffering=_OUTPUT_BUFFER_SIZE) as f:
+                    self._generate_interactive_ui(
+                        foia_request_content,
+                        final_report_content,
+                        has_processing_report,
+                        processing_metadata,
+                        embed_markdown,
+                        sink=f
+                    )
+                self._store_in_ui_cache(partial_path, cache_path)
+                os.replace(partial_path, ui_output_path)
+
+            # Auto-open in browser if requested, without waiting for it to launch
+            if auto_open:
+                threading.Thread(
+                    target=self._open_in_browser,
+                    args=(ui_output_path.resolve().as_uri(),)
+                ).start()
+
+            result_data = {
+                "ui_file": str(ui_output_path),
+                "auto_opened": auto_open,
+                "from_cache": cache_hit,
+                "tabs_generated": [
+                    "FOIA Request",
+                    "Final Report",
+                    "Processing Workflow" if has_processing_report else None
+                ],
+                "generation_metadata": {
+                    "generated_at": datetime.now().isoformat(),
+                    "output_directory": str(output_dir)
+                }
+            }
+
+            return self._create_result(
+                task.task_id,
+                success=True,
+                data=result_data,
+                reasoning="Successfully generated interactive tabbed UI and opened in browser",
+                confidence=0.95,
+                start_time=start_time
+            )
+
+        except Exception as e:
+            return self._create_result(
+                task.task_id,
+                success=False,
+                data={"error": str(e)},
+                reasoning=f"Error during interactive UI generation: {str(e)}",
+                confidence=0.0,
+                start_time=start_time
+            )
+
+    @staticmethod
+    def _open_in_browser(url: str):
+        """Open url in the default browser, ignoring failures."""
+        try:
+            webbrowser.open(url)
+        except Exception:
+            # Non-critical error
+            pass
+
+    def _ui_cache_key(
+        self,
+        foia_request: str,
+        final_report: str,
+        has_processing_report: bool,
+        embed_markdown: bool,
+        metadata_bytes: bytes
+    ) -> str:
+        """Content hash of everything the rendered viewer depends on."""
+        h = hashlib.blake2b(_TEMPLATE_DIGEST, digest_size=16)
+        h.update(b'\1' if has_processing_report else b'\0')
+        if not embed_markdown:
+            h.update(b'linked')
+        elif self._markdown is not None:
+            h.update(b'prerendered')
+        else:
+            h.update(b'embedded')
+        h.update(foia_request.encode('utf-8'))
+        h.update(b'\0')
+        h.update(final_report.encode('utf-8'))
+        h.update(b'\0')
+        h.update(metadata_bytes)
+        return h.hexdigest()
+
+    @staticmethod
+    def _copy_file(source: Path, target: Path):
+        """Copy source over target without writing through a link at target."""
+        partial_path = target.with_name(target.name + ".tmp")
+        shutil.copyfile(source, partial_path)
+        os.replace(partial_path, target)
+
+    @classmethod
+    def _store_in_ui_cache(cls, source: Path, cache_path: Path):
+        """Add the render at source to the cache under cache_path.
+
+        The entry is a second link to the render rather than a copy, so a miss
+        writes the page once. The viewer is always replaced, never rewritten
+        in place, so the entry keeps its contents.
+        """
+        cache_path.parent.mkdir(exist_ok=True)
+        partial_path = cache_path.with_suffix(".tmp")
+        try:
+            os.unlink(partial_path)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(source, partial_path)
+        except OSError:
+            # No hard links on this filesystem
+            shutil.copyfile(source, partial_path)
+        os.replace(partial_path, cache_path)
+        cls._prune_ui_cache(cache_path.parent)
+
+    @staticmethod
+    def _prune_ui_cache(cache_dir: Path):
+        """Remove the least recently used cached renders beyond the limit."""
+        entries = []
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".html"):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        pass
+        if len(entries) <= _UI_CACHE_MAX_ENTRIES:
+            return
+
+        entries.sort()
+        for _, path in entries[:-_UI_CACHE_MAX_ENTRIES]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _read_file(file_path) -> str:
+        """Read file content safely."""
+        try:
+            return Path(file_path).read_text(encoding='utf-8')
+        except Exception:
+            return _CONTENT_NOT_AVAILABLE
+
+    def _generate_interactive_ui(
+        self,
+        foia_request: str,
+        final_report: str,
+        has_processing_report: bool,
+        processing_metadata: Dict[str, Any],
+        embed_markdown: bool = True,
+        sink: Optional[BinaryIO] = None
+    ) -> Optional[str]:
+        """Generate the interactive tabbed UI HTML.
+
+        Without embed_markdown, the page references foia_request.md and
+        final_report.md next to it and fetches them when their tab opens.
+        Browsers block fetch() from file:// pages, so this only suits viewers
+        served over HTTP.
+
+        With a binary sink, the page is written to it as UTF-8 fragment by
+        fragment and None is returned; otherwise the page is built in memory
+        and returned.
         """
+        if sink is None:
+            buf = io.BytesIO()
+            self._generate_interactive_ui(
+                foia_request,
+                final_report,
+                has_processing_report,
+                processing_metadata,
+                embed_markdown,
+                sink=buf
+            )
+            return buf.getvalue().decode('utf-8')
 
-        return summary_html + timeline_html
+        markdown = self._markdown if embed_markdown else None
+        write = sink.write
+        write(_HTML_HEAD if markdown is None else _HTML_HEAD_PRERENDERED)
+        write(_TAB_BUTTONS)
+        if has_processing_report:
+            write(_WORKFLOW_TAB_BUTTON)
+
+        write(_PANES_HEAD)
+        if markdown is None:
+            write(_FOIA_REQUEST_LOADING)
+            write(_PANES_BETWEEN)
+            write(_FINAL_REPORT_LOADING)
+        else:
+            write(markdown.render(foia_request).encode('utf-8'))
+            write(_PANES_BETWEEN)
+            write(markdown.render(final_report).encode('utf-8'))
+        write(_PANES_TAIL)
+        if has_processing_report:
+            # Generate workflow HTML content from metadata
+            write(_WORKFLOW_TAB_FMT.format(
+                workflow_html=self._generate_workflow_html(processing_metadata)
+            ).encode('utf-8'))
+
+        write(_HTML_CONTENT_CLOSE)
+        if not embed_markdown:
+            write(_MARKDOWN_LINKS)
+        elif markdown is None:
+            # Embed the markdown as JSON data for the client script to render
+            write(_MARKDOWN_DATA_HEAD)
+            write(self._json_for_script(foia_request).encode('utf-8'))
+            write(_MARKDOWN_DATA_BETWEEN)
+            write(self._json_for_script(final_report).encode('utf-8'))
+            write(_MARKDOWN_DATA_TAIL)
+        write(_SCRIPT_TAIL_WITH_WORKFLOW if has_processing_report else _SCRIPT_TAIL_NO_WORKFLOW)
+        return None
+
+    @staticmethod
+    def _json_for_script(content: str) -> str:
+        """Encode content as JSON that is safe inside a <script> element."""
+        # Escaping "<" keeps "</script>" and "<!--" in the content from ending the block
+        return json.dumps(content, ensure_ascii=False).replace('<', '\\u003c')
+
+    @staticmethod
+    def _generate_workflow_html(metadata: Dict[str, Any]) -> str:
+        """Generate workflow HTML content from processing metadata."""
+        if not metadata:
+            return "<p>No processing metadata available.</p>"
+
+        # Extract key information
+        agent_results = metadata.get("agent_results", {})
+        status = metadata.get("status", "unknown")
+        total_time = metadata.get("processing_time", 0)
+        input_file = metadata.get("input_file", "Unknown")
+        output_dir = metadata.get("output_directory", "Unknown")
+
+        # Count successful agents
+        successful_agents = sum(1 for result in agent_results.values() if result.get("success", False))
+        total_agents = len(agent_results)
+
+        # Generate summary section
+        out = [_WORKFLOW_SUMMARY_FMT.format_map({
+            "total_time": total_time,
+            "total_agents": total_agents,
+            "successful_agents": successful_agents,
+            "success_rate": successful_agents / max(total_agents, 1) * 100,
+            "input_file": input_file,
+            "output_dir": output_dir,
+            "status_class": 'success' if status == 'completed' else 'failed',
+            "status": status.upper(),
+        })]
+
+        # Generate agent timeline
+        out.append(_WORKFLOW_TIMELINE_HEAD)
+        for agent_name, result in agent_results.items():
+            success = result.get("success", False)
+            reasoning = result.get("reasoning", "No reasoning provided")
+
+            # Get model used
+            data = result.get("data")
+            gen_meta = data.get("generation_metadata") if isinstance(data, dict) else None
+            model = gen_meta.get("model_used", "Unknown") if isinstance(gen_meta, dict) else "Unknown"
+
+            out.append(_AGENT_ITEM_FMT.format_map({
+                "status_class": "success" if success else "failed",
+                "status_text": "✅ Success" if success else "❌ Failed",
+                "display_name": agent_name.replace('_', ' ').title(),
+                "execution_time": result.get("execution_time", 0),
+                "confidence": result.get("confidence", 0),
+                "model": model,
+                "reasoning": reasoning[:200],
+                "ellipsis": '...' if len(reasoning) > 200 else '',
+            }))
+
+        out.append(_WORKFLOW_TIMELINE_TAIL)
+
+        return ''.join(out)
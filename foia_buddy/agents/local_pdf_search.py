@@ -1,10 +1,118 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, FrozenSet, Iterable, NamedTuple, Optional, Sequence, Tuple
+import functools
+import os
+import re
 import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from .base import BaseAgent
 from ..models import AgentResult, TaskMessage
 
 
+# Pool for stat calls, which release the GIL and mostly wait on the filesystem;
+# created on first use by _get_stat_executor
+_STAT_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+# Below this many files the pool hand-off costs more than serial stats
+_PARALLEL_STAT_THRESHOLD = 32
+
+
+def _get_stat_executor() -> ThreadPoolExecutor:
+    """Return the shared pool for stat calls, creating it on first use."""
+    global _STAT_EXECUTOR
+    if _STAT_EXECUTOR is None:
+        _STAT_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="pdf-stat")
+    return _STAT_EXECUTOR
+
+
+# Directories that do not hold FOIA documents and can be large to walk
+_PRUNED_DIR_NAMES = frozenset({"__pycache__", "node_modules"})
+
+# Filename terms that bump a PDF's relevance regardless of the request
+_BOOST_PATTERN = re.compile("foia|policy|memo|report")
+
+
+def _match_filenames(stems: Sequence[str], keywords: Sequence[str]) -> Tuple[List[List[str]], List[bool]]:
+    """Match keywords against all filenames at once.
+
+    The lowercased stems are joined on NUL, which cannot occur in a filename,
+    and each keyword is located with str.find over the whole corpus. Python
+    code runs once per hit instead of once per (file, keyword) pair. Returns
+    each file's matched keywords in keyword order and whether it contains a
+    boost term.
+    """
+    blob = "\0".join(stems)
+    starts = list(accumulate((len(stem) + 1 for stem in stems[:-1]), initial=0))
+    ends = starts[1:] + [len(blob)]
+
+    matched: List[List[str]] = [[] for _ in stems]
+    for keyword in keywords:
+        if not keyword or "\0" in keyword:
+            continue
+        pos = blob.find(keyword)
+        while pos != -1:
+            index = bisect_right(starts, pos) - 1
+            matched[index].append(keyword)
+            # Resume at the next filename so each file counts a keyword once
+            pos = blob.find(keyword, ends[index])
+
+    boosted = [False] * len(stems)
+    match = _BOOST_PATTERN.search(blob)
+    while match is not None:
+        index = bisect_right(starts, match.start()) - 1
+        boosted[index] = True
+        match = _BOOST_PATTERN.search(blob, ends[index])
+
+    return matched, boosted
+
+
+# Common keywords to look for in a FOIA request
+_IMPORTANT_TERMS = (
+    'ai', 'artificial intelligence', 'policy', 'governance',
+    'ethics', 'implementation', 'oversight', 'compliance',
+    'algorithm', 'machine learning', 'automation', 'framework',
+    'guideline', 'regulation', 'transparency', 'accountability',
+    'memo', 'memorandum', 'report', 'email', 'correspondence'
+)
+
+_QUOTED_PHRASE_PATTERN = re.compile(r'"([^"]+)"')
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_keywords(foia_request: str) -> Tuple[str, ...]:
+    """Extract key search terms from a FOIA request.
+
+    Cached by request text so retries and repeated requests skip the scan.
+    """
+    request_lower = foia_request.lower()
+
+    # Find matching terms
+    keywords = [term for term in _IMPORTANT_TERMS if term in request_lower]
+
+    # Extract quoted phrases
+    quoted = _QUOTED_PHRASE_PATTERN.findall(foia_request)
+    keywords.extend([q.lower() for q in quoted if len(q) > 2])
+
+    # Remove duplicates
+    keywords = list(dict.fromkeys(keywords))
+
+    # If no keywords found, use common document terms
+    if not keywords:
+        keywords = ['policy', 'memo', 'report', 'document']
+
+    return tuple(keywords[:15])  # Limit to top 15
+
+
+class PDFEntry(NamedTuple):
+    """A discovered PDF with the size and mtime read during the directory walk."""
+    path: Path
+    size: int
+    mtime: float
+
+
 class LocalPDFSearchAgent(BaseAgent):
     """
     Searches local PDF directory for documents relevant to FOIA requests.
@@ -13,13 +121,22 @@ class LocalPDFSearchAgent(BaseAgent):
     and identifies the most relevant ones to be parsed by the PDF Parser Agent.
     """
 
-    def __init__(self, nvidia_client, pdf_directory: str = "sample_data/pdfs"):
+    def __init__(
+        self,
+        nvidia_client,
+        pdf_directory: str = "sample_data/pdfs",
+        pruned_dirs: Iterable[str] = _PRUNED_DIR_NAMES
+    ):
         super().__init__(
             name="local_pdf_search",
             description="Searches local PDF directory for relevant documents",
             nvidia_client=nvidia_client
         )
         self.pdf_directory = pdf_directory
+        # Directory names never descended into, in addition to hidden directories
+        self.pruned_dirs = frozenset(pruned_dirs)
+        # (directory mtime, PDFs found) from the last scan
+        self._pdf_cache: Optional[Tuple[Dict[str, float], List[PDFEntry]]] = None
         self.add_capability("local_pdf_search")
         self.add_capability("pdf_discovery")
         self.add_capability("filename_analysis")
@@ -48,14 +165,15 @@ Provide structured analysis including:
 
     async def execute(self, task: TaskMessage) -> AgentResult:
         """Execute local PDF search task."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Get FOIA request from task
             foia_request = task.context.get("foia_request", "")
             max_pdfs = task.context.get("max_pdfs", 20)  # Limit PDFs to process
 
-            # Find all PDFs in directory
+            # Find all PDFs in directory, reusing the last scan while no
+            # directory in the tree has changed
             pdf_files = self._find_pdfs()
 
             if not pdf_files:
@@ -80,9 +198,9 @@ Provide structured analysis including:
                 # If no FOIA request, just return all PDFs
                 ranked_pdfs = [
                     {
-                        "path": str(pdf),
-                        "filename": pdf.name,
-                        "size": pdf.stat().st_size,
+                        "path": str(pdf.path),
+                        "filename": pdf.path.name,
+                        "size": pdf.size,
                         "relevance_score": 0.5,
                         "match_reason": "No FOIA request provided for ranking"
                     }
@@ -121,24 +239,97 @@ Provide structured analysis including:
                 start_time=start_time
             )
 
-    def _find_pdfs(self) -> List[Path]:
-        """Find all PDF files in the directory."""
+    def _find_pdfs(self, force_refresh: bool = False) -> List[PDFEntry]:
+        """Find all PDF files in the directory, newest first."""
+        return list(self._get_or_scan_pdfs(force_refresh))
+
+    def _get_or_scan_pdfs(self, force_refresh: bool = False) -> List[PDFEntry]:
+        """
+        Return the PDFs from the last scan, walking the tree only when needed.
+
+        The cached list is invalidated when the mtime of any directory it was
+        built from changes, so files added, removed or renamed anywhere in the
+        tree are picked up. Files rewritten in place keep their old size and
+        mtime until force_refresh=True. The returned list is shared with the
+        cache and must not be modified; _find_pdfs returns a copy.
+        """
         pdf_dir = Path(self.pdf_directory)
 
-        if not pdf_dir.exists():
-            return []
+        if not force_refresh and self._pdf_cache is not None:
+            dir_mtimes, pdf_files = self._pdf_cache
+            if self._dirs_unchanged(dir_mtimes):
+                return pdf_files
 
         # Find all PDFs recursively
-        pdf_files = list(pdf_dir.rglob("*.pdf"))
+        dir_mtimes = {}
+        pdf_files = self._walk_pdfs(pdf_dir, self.pruned_dirs, dir_mtimes)
+        if str(pdf_dir) not in dir_mtimes:
+            # The directory itself is missing or unreadable
+            self._pdf_cache = None
+            return []
 
         # Sort by modification time (most recent first)
-        pdf_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        pdf_files.sort(key=attrgetter("mtime"), reverse=True)
 
+        self._pdf_cache = (dir_mtimes, pdf_files)
         return pdf_files
 
+    @staticmethod
+    def _dirs_unchanged(dir_mtimes: Dict[str, float]) -> bool:
+        """Whether every directory still exists with the recorded mtime."""
+        try:
+            return all(os.stat(path).st_mtime == mtime for path, mtime in dir_mtimes.items())
+        except OSError:
+            return False
+
+    @staticmethod
+    def _walk_pdfs(
+        root: Path,
+        pruned_dirs: FrozenSet[str] = _PRUNED_DIR_NAMES,
+        dir_mtimes: Optional[Dict[str, float]] = None
+    ) -> List[PDFEntry]:
+        """
+        Recursively collect PDFs under root, stat-ing each file exactly once.
+
+        Hidden directories and those named in pruned_dirs are skipped along
+        with everything beneath them. When dir_mtimes is given, it is filled
+        with the mtime of each directory read, taken before reading it.
+        """
+        pdf_paths = []
+        pending = [str(root)]
+
+        while pending:
+            directory = pending.pop()
+            try:
+                if dir_mtimes is not None:
+                    dir_mtimes[directory] = os.stat(directory).st_mtime
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith(".") and entry.name not in pruned_dirs:
+                                pending.append(entry.path)
+                        elif entry.name.lower().endswith(".pdf"):
+                            pdf_paths.append(entry.path)
+            except OSError:
+                # Unreadable directories are skipped rather than failing the scan
+                if dir_mtimes is not None:
+                    dir_mtimes.pop(directory, None)
+                continue
+
+        # Large directories stat in parallel to overlap filesystem latency
+        if len(pdf_paths) < _PARALLEL_STAT_THRESHOLD:
+            stats = map(os.stat, pdf_paths)
+        else:
+            stats = _get_stat_executor().map(os.stat, pdf_paths)
+
+        return [
+            PDFEntry(Path(path), st.st_size, st.st_mtime)
+            for path, st in zip(pdf_paths, stats)
+        ]
+
     async def _rank_pdfs_by_relevance(
         self,
-        pdf_files: List[Path],
+        pdf_files: List[PDFEntry],
         foia_request: str
     ) -> List[Dict[str, Any]]:
         """
@@ -148,38 +339,34 @@ Provide structured analysis including:
         # Extract keywords from FOIA request
         keywords = self._extract_keywords_from_request(foia_request)
 
+        # Simple keyword matching in filenames, done for every PDF in one pass
+        matched, boosted = _match_filenames([pdf.path.stem.lower() for pdf in pdf_files], keywords)
+
         # Score each PDF
         ranked = []
-
-        for pdf_path in pdf_files:
-            filename = pdf_path.stem.lower()
-
-            # Simple keyword matching in filename
-            matches = sum(1 for keyword in keywords if keyword in filename)
+        for (pdf_path, size, _), matched_keywords, boost in zip(pdf_files, matched, boosted):
+            matches = len(matched_keywords)
 
             # Calculate relevance score
             score = min(matches / max(len(keywords), 1), 1.0) if keywords else 0.5
 
             # Boost score for certain patterns
-            if any(term in filename for term in ['foia', 'policy', 'memo', 'report']):
+            if boost:
                 score = min(score + 0.2, 1.0)
 
-            match_reasons = []
-            for keyword in keywords:
-                if keyword in filename:
-                    match_reasons.append(f"Filename contains '{keyword}'")
+            match_reasons = [f"Filename contains '{keyword}'" for keyword in matched_keywords]
 
             ranked.append({
                 "path": str(pdf_path),
                 "filename": pdf_path.name,
-                "size": pdf_path.stat().st_size,
+                "size": size,
                 "relevance_score": score,
                 "match_reason": "; ".join(match_reasons) if match_reasons else "General document",
-                "matched_keywords": [kw for kw in keywords if kw in filename]
+                "matched_keywords": matched_keywords
             })
 
         # Sort by relevance score
-        ranked.sort(key=lambda x: x["relevance_score"], reverse=True)
+        ranked.sort(key=itemgetter("relevance_score"), reverse=True)
 
         # Use AI to provide additional analysis for top PDFs
         if ranked[:5]:  # Analyze top 5
@@ -225,39 +412,12 @@ Keep each explanation to 1-2 sentences.
 
     def _extract_keywords_from_request(self, foia_request: str) -> List[str]:
         """Extract key search terms from FOIA request."""
-
-        # Common keywords to look for
-        request_lower = foia_request.lower()
-
-        important_terms = [
-            'ai', 'artificial intelligence', 'policy', 'governance',
-            'ethics', 'implementation', 'oversight', 'compliance',
-            'algorithm', 'machine learning', 'automation', 'framework',
-            'guideline', 'regulation', 'transparency', 'accountability',
-            'memo', 'memorandum', 'report', 'email', 'correspondence'
-        ]
-
-        # Find matching terms
-        keywords = [term for term in important_terms if term in request_lower]
-
-        # Extract quoted phrases
-        import re
-        quoted = re.findall(r'"([^"]+)"', foia_request)
-        keywords.extend([q.lower() for q in quoted if len(q) > 2])
-
-        # Remove duplicates
-        keywords = list(dict.fromkeys(keywords))
-
-        # If no keywords found, use common document terms
-        if not keywords:
-            keywords = ['policy', 'memo', 'report', 'document']
-
-        return keywords[:15]  # Limit to top 15
+        return list(_extract_keywords(foia_request))
 
     def get_pdf_count(self) -> int:
         """Get total count of PDFs in directory."""
-        return len(self._find_pdfs())
+        return len(self._get_or_scan_pdfs())
 
     def get_pdf_list(self) -> List[str]:
         """Get list of all PDF filenames."""
-        return [pdf.name for pdf in self._find_pdfs()]
+        return [pdf.path.name for pdf in self._get_or_scan_pdfs()]
@@ -1,12 +1,220 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
+import asyncio
+import atexit
+import functools
+import hashlib
 import time
 import base64
 import json
 import io
 import mimetypes
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
 from pathlib import Path
 from .base import BaseAgent
 from ..models import AgentResult, TaskMessage
+from ..utils import fast_json
+
+# Optional dependencies, resolved once at import; a clear error is raised on
+# first use when one that is needed is missing
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pypdfium2 is optional; pages are then rendered with pdf2image
+    pdfium = None
+
+try:
+    import pdf2image
+except ImportError:
+    pdf2image = None
+
+try:
+    from PIL import Image
+except ImportError:  # installed alongside either renderer
+    Image = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  HTTP/2 multiplexes concurrent pages on one connection
+except ImportError:
+    h2 = None
+
+# Encodings for page images sent to the parse model, keyed by the
+# PDF_PAGE_IMAGE_FORMAT setting: (PIL format, MIME type)
+_PAGE_IMAGE_FORMATS = {
+    "jpeg": ("JPEG", "image/jpeg"),
+    "png": ("PNG", "image/png"),
+}
+# JPEG encodes several times faster than PNG and yields a much smaller upload
+_DEFAULT_PAGE_IMAGE_FORMAT = "jpeg"
+_JPEG_QUALITY = 85
+
+# Black rows between pages when several pages share one parse request
+_PAGE_GAP = 5
+
+# Default limits on concurrent parse requests (shared by all pages in a batch)
+# and on PDFs being processed at once; both can be set in the task context
+_DEFAULT_CONCURRENCY = 8
+_DEFAULT_PDF_CONCURRENCY = 4
+
+
+# Worker processes for page rendering and encoding, created on first use
+_RENDER_EXECUTOR: Optional[ProcessPoolExecutor] = None
+
+
+def _get_render_executor() -> ProcessPoolExecutor:
+    """
+    Return the shared worker pool for page rendering, creating it on first use.
+
+    Workers are spawned rather than forked: the parser runs in processes that
+    already have threads (the asyncio default executor, Streamlit's server),
+    and a forked child can inherit a lock held by one of them.
+    """
+    global _RENDER_EXECUTOR
+    if _RENDER_EXECUTOR is None:
+        _RENDER_EXECUTOR = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        atexit.register(_RENDER_EXECUTOR.shutdown)
+    return _RENDER_EXECUTOR
+
+
+def _require_pdf_renderer():
+    """
+    Raise ImportError unless a page renderer is installed.
+
+    pypdfium2 renders in-process with PDFium and is preferred; pdf2image runs
+    poppler's pdftoppm once per page.
+    """
+    if pdfium is None and pdf2image is None:
+        raise ImportError(
+            "pypdfium2 or pdf2image library required for PDF parsing. "
+            "Install with: pip install pypdfium2\n"
+            "(pdf2image also works but requires poppler-utils: "
+            "brew install poppler (macOS) or apt-get install poppler-utils (Linux))"
+        )
+
+
+def _count_pages(pdf_path: str) -> int:
+    """Number of pages in a PDF."""
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    return pdf2image.pdfinfo_from_path(pdf_path)["Pages"]
+
+
+def _render_pages(pdf_path: str, first_index: int, count: int, dpi: int) -> list:
+    """Render count consecutive pages of a PDF, starting at first_index, as PIL images."""
+    if pdfium is None:
+        return pdf2image.convert_from_path(
+            pdf_path, dpi=dpi, first_page=first_index + 1, last_page=first_index + count
+        )
+
+    images = []
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page_index in range(first_index, first_index + count):
+            page = pdf[page_index]
+            try:
+                # PDF user space is 72 units per inch
+                images.append(page.render(scale=dpi / 72).to_pil())
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return images
+
+
+def _stack_pages(images: list):
+    """Stack page images top to bottom on one black canvas, with a gap between pages."""
+    width = max(image.width for image in images)
+    height = sum(image.height for image in images) + _PAGE_GAP * (len(images) - 1)
+    canvas = Image.new("RGB", (width, height))
+    top = 0
+    for image in images:
+        canvas.paste(image, (0, top))
+        top += image.height + _PAGE_GAP
+    return canvas
+
+
+def _render_and_encode_pages(
+    pdf_path: str, first_index: int, count: int, dpi: int, image_format: str
+) -> bytes:
+    """
+    Render count consecutive pages of a PDF and encode them as one image in image_format.
+
+    Runs on the render worker pool, so it takes only picklable arguments and
+    opens the document itself.
+    """
+    images = _render_pages(pdf_path, first_index, count, dpi)
+    image = images[0] if len(images) == 1 else _stack_pages(images)
+    del images
+
+    pil_format, _ = _PAGE_IMAGE_FORMATS[image_format]
+    buffer = io.BytesIO()
+    if pil_format == "JPEG":
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(buffer, format=pil_format, quality=_JPEG_QUALITY)
+    else:
+        image.save(buffer, format=pil_format)
+    return buffer.getvalue()
+
+
+# Parsed markdown cached by PDF content hash, inside the output directory
+_PARSE_CACHE_DIR = ".cache"
+# Each entry's markdown length (in characters) is kept next to it in this file
+_LENGTH_SUFFIX = ".len"
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Written between pages in the parsed markdown
+_PAGE_SEPARATOR = "\n\n---\n\n"
+
+# Parsed markdown is written a page at a time; the buffer batches those writes
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Stands in for the page's base64 data when the request body is serialized
+_IMAGE_DATA_PLACEHOLDER = "@@image-data@@"
+
+
+@functools.lru_cache(maxsize=16)
+def _request_body_parts(model_name: str, mime: str, tool_name: str) -> Tuple[bytes, bytes]:
+    """
+    Serialize a parse request once and split it around the image data.
+
+    Base64 output only uses characters that need no JSON escaping, so a full
+    request body is head + base64 bytes + tail.
+    """
+    # Construct the content with HTML img tag (as per nemotron-parse API)
+    content = f'<img src="data:{mime};base64,{_IMAGE_DATA_PLACEHOLDER}" />'
+
+    payload = {
+        "model": model_name,
+        "messages": [
+            {
+                "role": "user",
+                "content": content
+            }
+        ],
+        "tools": [{"type": "function", "function": {"name": tool_name}}],
+        "tool_choice": {"type": "function", "function": {"name": tool_name}},
+        "max_tokens": 8000,  # Model max context is 9000 tokens
+    }
+
+    head, tail = json.dumps(payload).encode('utf-8').split(_IMAGE_DATA_PLACEHOLDER.encode('ascii'))
+    return head, tail
 
 
 class PDFParserAgent(BaseAgent):
@@ -19,7 +227,7 @@ class PDFParserAgent(BaseAgent):
     to well-formatted markdown with visual element descriptions.
     """
 
-    def __init__(self, nvidia_client):
+    def __init__(self, nvidia_client, render_dpi: int = 200, pages_per_request: int = 1):
         super().__init__(
             name="pdf_parser",
             description="Converts PDF documents to markdown using NVIDIA Nemotron Parse model",
@@ -33,7 +241,30 @@ class PDFParserAgent(BaseAgent):
             "markdown_no_bbox",  # Markdown without bounding boxes
             "detection_only",    # Detection only
         ]
+        self._tools_set = frozenset(self.tools)
         self.default_tool = "markdown_no_bbox"  # Default to markdown without bbox
+        # Request headers are the same for every parse call
+        self._headers = {
+            "Authorization": f"Bearer {nvidia_client.api_key}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        # Page render resolution; lower values trade OCR detail for speed
+        self.render_dpi = render_dpi
+        # Pages stacked into one image per parse request; fewer round-trips for
+        # documents of short pages, at the cost of per-page headings
+        self.pages_per_request = max(1, pages_per_request)
+        # Page image encoding; PDF_PAGE_IMAGE_FORMAT=png sends lossless pages
+        page_format = os.getenv("PDF_PAGE_IMAGE_FORMAT", _DEFAULT_PAGE_IMAGE_FORMAT).lower()
+        if page_format not in _PAGE_IMAGE_FORMATS:
+            page_format = _DEFAULT_PAGE_IMAGE_FORMAT
+        self.page_image_format = page_format
+        # Async HTTP client for parse requests and the event loop it belongs to
+        self._http_client = None
+        self._http_client_loop = None
+        # Futures for parses under way, keyed by cache path, so identical PDFs
+        # in a batch are parsed once
+        self._parses_in_flight: Dict[Path, asyncio.Future] = {}
         self.add_capability("pdf_parsing")
         self.add_capability("document_conversion")
         self.add_capability("markdown_generation")
@@ -70,7 +301,7 @@ Output markdown that is:
 
     async def execute(self, task: TaskMessage) -> AgentResult:
         """Execute PDF parsing task."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Get PDF paths from task context
@@ -94,19 +325,41 @@ Output markdown that is:
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
 
-            # Parse each PDF
+            # Parse PDFs concurrently; page requests share one limit across the batch
+            concurrency = max(1, int(task.context.get("concurrency", _DEFAULT_CONCURRENCY)))
+            page_semaphore = asyncio.Semaphore(concurrency)
+            pdf_semaphore = asyncio.Semaphore(
+                max(1, int(task.context.get("pdf_concurrency", _DEFAULT_PDF_CONCURRENCY)))
+            )
+
+            async def parse_one(pdf_path: str, markdown_filename: str) -> Dict[str, Any]:
+                async with pdf_semaphore:
+                    return await self._parse_pdf(
+                        pdf_path, output_path, page_semaphore, markdown_filename
+                    )
+
+            outcomes = await asyncio.gather(
+                *(
+                    parse_one(pdf_path, markdown_filename)
+                    for pdf_path, markdown_filename
+                    in zip(pdf_paths, self._markdown_filenames(pdf_paths))
+                ),
+                return_exceptions=True
+            )
+
             parsed_results = []
             errors = []
 
-            for pdf_path in pdf_paths:
-                try:
-                    result = await self._parse_pdf(pdf_path, output_path)
-                    parsed_results.append(result)
-                except Exception as e:
+            for pdf_path, outcome in zip(pdf_paths, outcomes):
+                if isinstance(outcome, Exception):
                     errors.append({
                         "pdf_path": pdf_path,
-                        "error": str(e)
+                        "error": str(outcome)
                     })
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    parsed_results.append(outcome)
 
             result_data = {
                 "parsed_count": len(parsed_results),
@@ -140,71 +393,257 @@ Output markdown that is:
                 confidence=0.0,
                 start_time=start_time
             )
+        finally:
+            # Connections belong to this event loop; close them rather than
+            # leave them to a later run on another loop
+            await self.aclose()
 
-    async def _parse_pdf(self, pdf_path: str, output_dir: Path) -> Dict[str, Any]:
+    async def _parse_pdf(
+        self,
+        pdf_path: str,
+        output_dir: Path,
+        page_semaphore: Optional[asyncio.Semaphore] = None,
+        markdown_filename: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Parse a single PDF document using NVIDIA Nemotron VL model.
 
+        Pages are sent to the model concurrently, with at most as many
+        requests (and encoded pages) in flight as page_semaphore allows.
+
         Args:
             pdf_path: Path to the PDF file
             output_dir: Directory to save markdown output
+            page_semaphore: Limit on concurrent page requests, shared across PDFs
+            markdown_filename: Output file name (default: the PDF's stem + .md)
 
         Returns:
             Dictionary with parsing results
         """
-        pdf_file = Path(pdf_path)
-
-        if not pdf_file.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-
-        # Convert PDF to images first (nemotron-parse requires images, not PDFs)
         try:
-            from pdf2image import convert_from_path
-        except ImportError:
-            raise ImportError(
-                "pdf2image library required for PDF parsing. "
-                "Install with: pip install pdf2image\n"
-                "Also requires poppler-utils: brew install poppler (macOS) or apt-get install poppler-utils (Linux)"
-            )
-
-        # Convert PDF pages to images
-        images = convert_from_path(str(pdf_file), dpi=200)
-
-        # Parse each page
-        page_markdowns = []
-        for page_num, image in enumerate(images, start=1):
-            # Convert PIL Image to base64
-            import io
-            buffer = io.BytesIO()
-            image.save(buffer, format='PNG')
-            image_bytes = buffer.getvalue()
-            b64_str = base64.b64encode(image_bytes).decode('ascii')
-
-            # Call Parse model to convert page to markdown
-            page_markdown = await self._call_vl_model(b64_str, "image/png")
-            page_markdowns.append(f"# Page {page_num}\n\n{page_markdown}")
-
-        # Combine all pages
-        markdown_content = "\n\n---\n\n".join(page_markdowns)
-
-        # Save markdown to file
-        markdown_filename = pdf_file.stem + ".md"
+            pdf_stat = os.stat(pdf_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}") from None
+
+        pdf_filename = os.path.basename(pdf_path)
+        if markdown_filename is None:
+            stem, _ = os.path.splitext(pdf_filename)
+            markdown_filename = stem + ".md"
         markdown_path = output_dir / markdown_filename
+        loop = asyncio.get_running_loop()
+
+        # Identical PDFs (same bytes under any name) reuse an earlier parse. A
+        # copy of an identical PDF still being parsed in this batch waits for
+        # that parse instead of starting its own.
+        cache_key = await loop.run_in_executor(None, self._parse_cache_key, pdf_path)
+        cache_path = output_dir / _PARSE_CACHE_DIR / f"{cache_key}.md"
+        in_flight = self._parses_in_flight.get(cache_path)
+        while in_flight is not None:
+            await asyncio.wait([in_flight])
+            in_flight = self._parses_in_flight.get(cache_path)
+        if cache_path.exists():
+            self._copy_markdown(cache_path, markdown_path)
+            return {
+                "pdf_path": pdf_path,
+                "pdf_filename": pdf_filename,
+                "markdown_path": str(markdown_path),
+                "markdown_filename": markdown_filename,
+                "file_size": pdf_stat.st_size,
+                "markdown_length": self._cached_markdown_length(cache_path),
+                "pages_parsed": 0,
+                "status": "cache_hit"
+            }
 
-        with open(markdown_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        # Pages are written to a file of this parse's own, which replaces the
+        # output only once complete
+        in_flight = self._parses_in_flight[cache_path] = loop.create_future()
+        partial_path = self._partial_path(markdown_path)
+        try:
+            page_count, markdown_length = await self._parse_pages(
+                pdf_path, partial_path, page_semaphore
+            )
+            # The cache keeps its own copy, so edits to the output file cannot reach it
+            cache_path.parent.mkdir(exist_ok=True)
+            self._copy_markdown(partial_path, cache_path)
+            cache_path.with_suffix(_LENGTH_SUFFIX).write_text(str(markdown_length), encoding='ascii')
+            os.replace(partial_path, markdown_path)
+        finally:
+            with suppress(FileNotFoundError):
+                partial_path.unlink()
+            del self._parses_in_flight[cache_path]
+            in_flight.set_result(None)
 
         return {
             "pdf_path": pdf_path,
-            "pdf_filename": pdf_file.name,
+            "pdf_filename": pdf_filename,
             "markdown_path": str(markdown_path),
             "markdown_filename": markdown_filename,
-            "file_size": pdf_file.stat().st_size,
-            "markdown_length": len(markdown_content),
-            "pages_parsed": len(images),
+            "file_size": pdf_stat.st_size,
+            "markdown_length": markdown_length,
+            "pages_parsed": page_count,
             "status": "success"
         }
 
+    async def _parse_pages(
+        self,
+        pdf_path: str,
+        markdown_path: Path,
+        page_semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Tuple[int, int]:
+        """
+        Parse every page of a PDF and write the markdown to markdown_path,
+        replacing its contents.
+
+        Returns:
+            The page count and the length of the markdown written
+        """
+        _require_pdf_renderer()
+        loop = asyncio.get_running_loop()
+        if page_semaphore is None:
+            page_semaphore = asyncio.Semaphore(_DEFAULT_CONCURRENCY)
+        mime = self._page_image_mime()
+        executor = _get_render_executor()
+
+        async def parse_page(page_index: int) -> str:
+            # Pages page_index onward, up to pages_per_request of them, in one request
+            count = min(self.pages_per_request, page_count - page_index)
+            # Render and encode on a worker process so pages render in parallel
+            # and the event loop stays free for API calls
+            image_bytes = await loop.run_in_executor(
+                executor, _render_and_encode_pages,
+                pdf_path, page_index, count, self.render_dpi, self.page_image_format
+            )
+            # Kept as ASCII bytes; they go into the request body without decoding
+            b64_data = base64.b64encode(image_bytes)
+            del image_bytes
+
+            # Call Parse model to convert page to markdown
+            page_markdown = await self._call_vl_model(b64_data, mime)
+            if count == 1:
+                return f"# Page {page_index + 1}\n\n{page_markdown}"
+            return f"# Pages {page_index + 1}-{page_index + count}\n\n{page_markdown}"
+
+        def release_page_slot(_):
+            page_semaphore.release()
+
+        # Parse each page (nemotron-parse requires images, not PDFs)
+        if pdfium is not None:
+            # Opening the document only reads its page tree; cheaper than a hop
+            # to a worker
+            page_count = _count_pages(pdf_path)
+        else:
+            # pdf2image runs pdfinfo as a subprocess; wait for it off the loop
+            page_count = await loop.run_in_executor(None, _count_pages, pdf_path)
+        page_tasks = []
+        pages_written = 0
+        markdown_length = 0
+
+        # Save markdown to file page by page, in page order, as results arrive
+        with open(markdown_path, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+
+            def write_page(page_markdown: str):
+                nonlocal pages_written, markdown_length
+                if pages_written:
+                    f.write(_PAGE_SEPARATOR)
+                    markdown_length += len(_PAGE_SEPARATOR)
+                f.write(page_markdown)
+                markdown_length += len(page_markdown)
+                # Drop the finished task so its markdown is not kept alive
+                page_tasks[pages_written] = None
+                pages_written += 1
+
+            try:
+                for page_index in range(0, page_count, self.pages_per_request):
+                    await page_semaphore.acquire()
+                    page_task = asyncio.ensure_future(parse_page(page_index))
+                    # Released on completion, failure or cancellation alike
+                    page_task.add_done_callback(release_page_slot)
+                    page_tasks.append(page_task)
+
+                    # Write whatever leading pages have already finished
+                    while pages_written < len(page_tasks) and page_tasks[pages_written].done():
+                        write_page(page_tasks[pages_written].result())
+
+                while pages_written < len(page_tasks):
+                    write_page(await page_tasks[pages_written])
+            except BaseException:
+                # One failed page fails the document; stop its other requests
+                for page_task in page_tasks:
+                    if page_task is not None:
+                        page_task.cancel()
+                raise
+
+        return page_count, markdown_length
+
+    def _parse_cache_key(self, pdf_path: str) -> str:
+        """Content hash of a PDF together with the settings that shape its markdown."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{self.model_name}\0{self.default_tool}\0{self.render_dpi}\0{self.page_image_format}\0{self.pages_per_request}\0".encode('utf-8'))
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(functools.partial(f.read, _HASH_CHUNK_SIZE), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    @staticmethod
+    def _cached_markdown_length(cache_path: Path) -> int:
+        """Length of a cached parse, from the file stored beside it."""
+        length_path = cache_path.with_suffix(_LENGTH_SUFFIX)
+        try:
+            return int(length_path.read_text(encoding='ascii'))
+        except (OSError, ValueError):
+            # Entry from before lengths were stored; measure it once
+            length = len(cache_path.read_text(encoding='utf-8'))
+            with suppress(OSError):
+                length_path.write_text(str(length), encoding='ascii')
+            return length
+
+    @staticmethod
+    def _markdown_filenames(pdf_paths: List[str]) -> List[str]:
+        """
+        Output file names for a batch, one per PDF in order.
+
+        A PDF's name is its stem + .md; different PDFs sharing a stem (the same
+        file name in different directories) get numbered names so their
+        outputs do not overwrite each other.
+        """
+        owners = {}
+        filenames = []
+        for pdf_path in pdf_paths:
+            owner = os.path.abspath(pdf_path)
+            stem, _ = os.path.splitext(os.path.basename(pdf_path))
+            filename = stem + ".md"
+            number = 1
+            while owners.setdefault(filename, owner) != owner:
+                number += 1
+                filename = f"{stem}-{number}.md"
+            filenames.append(filename)
+        return filenames
+
+    @staticmethod
+    def _partial_path(target: Path) -> Path:
+        """A new, uniquely named file next to target, to be renamed over it."""
+        fd, partial_name = tempfile.mkstemp(
+            prefix=f".{target.name}.", suffix=".tmp", dir=target.parent
+        )
+        os.close(fd)
+        return Path(partial_name)
+
+    @classmethod
+    def _copy_markdown(cls, source: Path, target: Path):
+        """Copy source over target without writing through a link at target."""
+        partial_path = cls._partial_path(target)
+        try:
+            shutil.copyfile(source, partial_path)
+            os.replace(partial_path, target)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                partial_path.unlink()
+            raise
+
+    def _page_image_mime(self) -> str:
+        """MIME type of the page images sent to the parse model."""
+        return _PAGE_IMAGE_FORMATS[self.page_image_format][1]
+
     def _read_file_as_base64(self, path: str) -> tuple[str, str]:
         """Read file and encode as base64."""
         with open(path, "rb") as f:
@@ -222,7 +661,7 @@ Output markdown that is:
 
     async def _call_vl_model(
         self,
-        b64_str: str,
+        b64_data: Union[str, bytes],
         mime: str,
         tool_name: Optional[str] = None
     ) -> str:
@@ -230,72 +669,37 @@ Output markdown that is:
         Call NVIDIA Nemotron Parse API to convert document to markdown.
 
         Args:
-            b64_str: Base64-encoded document
+            b64_data: Base64-encoded document, as text or ASCII bytes
             mime: MIME type of the document
             tool_name: Parsing tool to use (default: markdown_no_bbox)
 
         Returns:
             Markdown content
         """
-        try:
-            import requests
-        except ImportError:
-            raise ImportError("requests library required. Install with: pip install requests")
-
         # Use default tool if not specified
         if tool_name is None:
             tool_name = self.default_tool
 
         # Validate tool name
-        if tool_name not in self.tools:
+        if tool_name not in self._tools_set:
             raise ValueError(f"Invalid tool name: {tool_name}. Must be one of {self.tools}")
 
-        # Construct the content with HTML img tag (as per nemotron-parse API)
-        data_uri = f"data:{mime};base64,{b64_str}"
-        content = f'<img src="{data_uri}" />'
-
-        # Prepare API request
-        headers = {
-            "Authorization": f"Bearer {self.nvidia_client.api_key}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-
-        # Prepare tool specification
-        tool_spec = [{"type": "function", "function": {"name": tool_name}}]
-
-        # Format content as array if needed (some models require this)
-        # Try with simple string first, as shown in example
-        message_content = content
-
-        payload = {
-            "model": self.model_name,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": message_content
-                }
-            ],
-            "tools": tool_spec,
-            "tool_choice": {"type": "function", "function": {"name": tool_name}},
-            "max_tokens": 8000,  # Model max context is 9000 tokens
-        }
+        # The endpoint only takes JSON, so the body is assembled around the
+        # image data rather than passing a multi-MB data URI through json.dumps
+        if isinstance(b64_data, str):
+            b64_data = b64_data.encode('ascii')
+        body_head, body_tail = _request_body_parts(self.model_name, mime, tool_name)
+        body = b"".join((body_head, b64_data, body_tail))
 
-        # Make API call
-        response = requests.post(
-            self.parse_api_url,
-            headers=headers,
-            json=payload,
-            timeout=180  # Longer timeout for parsing processing
-        )
+        # Make API call on the shared async client so concurrent pages reuse connections
+        client = self._get_http_client()
+        response = await client.post(self.parse_api_url, headers=self._headers, content=body)
 
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as e:
+        if response.is_error:
             raise Exception(f"Nemotron Parse API error: {response.status_code} - {response.text}")
 
-        # Extract markdown from response
-        response_data = response.json()
+        # Extract markdown from response; the raw bytes go straight to the parser
+        response_data = fast_json.loads(response.content)
 
         try:
             choices = response_data.get("choices", [])
@@ -311,7 +715,7 @@ Output markdown that is:
                 function_args = tool_calls[0].get("function", {}).get("arguments", "")
                 if function_args:
                     # Parse the arguments as JSON
-                    args_data = json.loads(function_args) if isinstance(function_args, str) else function_args
+                    args_data = fast_json.loads(function_args) if isinstance(function_args, str) else function_args
                     # The markdown content should be in the arguments
                     # Handle both dict and list responses
                     if isinstance(args_data, dict):
@@ -345,6 +749,33 @@ Output markdown that is:
         except (KeyError, IndexError, json.JSONDecodeError) as e:
             raise Exception(f"Error parsing Nemotron Parse response: {str(e)}")
 
+    def _get_http_client(self):
+        """
+        Return the async HTTP client for parse requests, creating it on first use.
+
+        Connection pools belong to the event loop they were opened on, so a
+        new client is created when the agent is used from a different loop.
+        """
+        if httpx is None:
+            raise ImportError("httpx library required. Install with: pip install httpx")
+
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client_loop is not loop:
+            self._http_client = httpx.AsyncClient(
+                http2=h2 is not None,
+                timeout=180,  # Longer timeout for parsing processing
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
+            self._http_client_loop = loop
+        return self._http_client
+
+    async def aclose(self):
+        """Close the HTTP client used for parse requests."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_client_loop = None
+
     async def parse_multiple_pdfs(
         self,
         pdf_paths: List[str],
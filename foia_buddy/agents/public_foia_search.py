@@ -52,7 +52,7 @@ Provide structured analysis including:
 
     async def execute(self, task: TaskMessage) -> AgentResult:
         """Execute public FOIA library search task."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Get FOIA request from task
@@ -49,7 +49,7 @@ CRITICAL OUTPUT FORMAT INSTRUCTIONS:
 
     async def execute(self, task: TaskMessage) -> AgentResult:
         """Execute report generation task."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Get research results and FOIA request from task context
@@ -1,3 +1,5 @@
 from .nvidia_client import NvidiaClient
+from .response_cache import ResponseCache
+from . import fast_json, minify
 
-__all__ = ["NvidiaClient"]
\ No newline at end of file
+__all__ = ["NvidiaClient", "ResponseCache", "fast_json", "minify"]
@@ -0,0 +1,47 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse JSON from text or UTF-8 bytes, using orjson when installed.
+
+    Raises ``json.JSONDecodeError`` on invalid input with either backend.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to JSON text, using orjson when installed.
+
+    Values that are not JSON types, datetimes and dataclasses included, are
+    converted with ``str()``. Keys follow ``json.dumps``: str, int, float,
+    bool and None are accepted, anything else raises ``TypeError``. Output is
+    compact, or uses two-space indentation with ``indent``, and is the same
+    text with either backend.
+    """
+    if orjson is not None:
+        option = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | (orjson.OPT_INDENT_2 if indent else 0)
+        )
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+        except TypeError:
+            # Non-str keys and integers beyond 64 bits; the standard library
+            # handles both
+            pass
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        ensure_ascii=False,
+        default=str
+    )
@@ -0,0 +1,23 @@
+import re
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_WHITESPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACE = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _WHITESPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION_SPACE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(script: str) -> str:
+    """Strip indentation, blank lines and whole-line ``//`` comments from a script.
+
+    Line breaks are kept, so automatic semicolon insertion is unaffected.
+    Scripts must not contain string literals that span lines.
+    """
+    lines = (line.strip() for line in script.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
@@ -19,7 +19,7 @@ class NvidiaClient:
 
     def generate_response(
         self,
-        messages: List[Dict[str, str]],
+        messages: List[Dict[str, Any]],
         model: str = "nvidia/nvidia-nemotron-nano-9b-v2",
         temperature: float = 0.6,
         max_tokens: int = 2048,
@@ -67,7 +67,7 @@ class NvidiaClient:
 
     def generate_with_function_calling(
         self,
-        messages: List[Dict[str, str]],
+        messages: List[Dict[str, Any]],
         functions: List[Dict[str, Any]],
         model: str = "nvidia/nvidia-nemotron-nano-9b-v2"
     ) -> Dict[str, Any]:
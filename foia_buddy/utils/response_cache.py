@@ -0,0 +1,53 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+
+
+class ResponseCache:
+    """In-memory LRU cache for model responses with a time-to-live."""
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 7 * 24 * 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(messages: List[Dict[str, Any]], use_thinking: bool) -> str:
+        """Build a content-addressed key for a request."""
+        payload = json.dumps(messages, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(payload + bytes([use_thinking])).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, response = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return dict(response)
+
+    def set(self, key: str, response: Dict[str, Any]):
+        """Store a response, evicting the least recently used entry if full."""
+        if "error" in response:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), dict(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
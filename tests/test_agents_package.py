@@ -0,0 +1,29 @@
+import importlib
+import sys
+
+import pytest
+
+import foia_buddy.agents as agents
+
+
+def test_agent_classes_import_on_first_access():
+    sys.modules.pop("foia_buddy.agents.launcher_ui_generator", None)
+    agents.__dict__.pop("LauncherUIGeneratorAgent", None)
+
+    agent_class = agents.LauncherUIGeneratorAgent
+
+    module = importlib.import_module("foia_buddy.agents.launcher_ui_generator")
+    assert agent_class is module.LauncherUIGeneratorAgent
+    # Later lookups skip __getattr__
+    assert agents.__dict__["LauncherUIGeneratorAgent"] is agent_class
+
+
+def test_every_exported_name_resolves():
+    for name in agents.__all__:
+        assert getattr(agents, name).__name__ == name
+    assert set(agents.__all__) <= set(dir(agents))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        agents.NoSuchAgent
@@ -0,0 +1,43 @@
+import asyncio
+
+from foia_buddy.agents.coordinator import CoordinatorAgent
+from foia_buddy.models import TaskMessage
+
+
+def _execute(content):
+    agent = CoordinatorAgent(nvidia_client=None)
+
+    async def fake_response(messages, use_thinking=True):
+        return {"content": content, "reasoning": ""}
+
+    agent._generate_response = fake_response
+    task = TaskMessage(
+        task_id="t",
+        agent_type="coordinator",
+        instructions="plan",
+        context={"foia_request": "All memos"}
+    )
+    result = asyncio.run(agent.execute(task))
+    assert result.success, result.data
+    return result.data["coordination_plan"]
+
+
+def test_plan_json_is_found_between_leading_and_trailing_text():
+    plan = _execute(
+        'Here is the plan:\n'
+        '{"analysis": "Memos {2023}", "execution_plan": [{"agent": "pdf_parser", "priority": 1}]}\n'
+        'Let me know if the {scope} should change.'
+    )
+
+    assert plan == {
+        "analysis": "Memos {2023}",
+        "execution_plan": [{"agent": "pdf_parser", "priority": 1}],
+    }
+
+
+def test_invalid_plan_json_falls_back_to_text_plan():
+    content = "Plan: {not json} then more text"
+    plan = _execute(content)
+
+    assert plan["analysis"] == content
+    assert plan["execution_plan"]
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from foia_buddy.agents.document_researcher import DocumentResearcherAgent, _extract_relevant_sections
+
+
+@pytest.fixture
+def agent(tmp_path):
+    return DocumentResearcherAgent(nvidia_client=None, document_directory=str(tmp_path))
+
+
+def test_read_document_normalizes_line_endings(agent, tmp_path):
+    path = tmp_path / "crlf.md"
+    path.write_bytes(b"First paragraph\r\n\r\nSecond\rline\n")
+
+    assert agent._read_document(str(path)) == "First paragraph\n\nSecond\nline\n"
+
+
+def test_read_document_missing_file_is_empty(agent, tmp_path):
+    assert agent._read_document(str(tmp_path / "missing.md")) == ""
+
+
+def test_analyze_document_runs_local_scans(agent):
+    async def generate_response(messages, use_thinking=True):
+        return {"content": "This document is relevant."}
+
+    agent._generate_response = generate_response
+    content = (
+        "Budget memo covering contract spending for the program office.\n\n"
+        "Email the records officer at records@example.gov or phone 555-123-4567."
+    )
+
+    analysis = asyncio.run(agent._analyze_document(content, "budget contract spending", "memo.md"))
+
+    assert analysis["relevant_sections"] == [
+        "Budget memo covering contract spending for the program office."
+    ]
+    assert analysis["redaction_flags"] == ["Email addresses", "Phone numbers"]
+
+
+def _sections_by_paragraph_scan(content, foia_request):
+    """Reference: count every request word found in each paragraph."""
+    foia_keywords = [word.lower() for word in foia_request.split() if len(word) > 2]
+    sections = []
+    for para in content.split("\n\n"):
+        if len(para) > 50:
+            keyword_count = sum(1 for keyword in foia_keywords if keyword in para.lower())
+            if keyword_count >= 2:
+                sections.append(para.strip()[:500] + "..." if len(para) > 500 else para.strip())
+                if len(sections) == 3:
+                    break
+    return sections
+
+
+CONTENT = "\n\n".join([
+    "The contract was signed by the agency after a long review of the budget.",
+    "Only the contract is mentioned in this paragraph, and nothing else at all.",
+    "Subcontracting arrangements were reviewed by the inspector general office.",
+    "short contract budget",
+    "Budget " * 120,
+])
+
+
+@pytest.mark.parametrize("foia_request", [
+    "contract budget",
+    "contract contract",
+    "Contract records for the contracting office",
+    "contract subcontract review",
+    "an of to",
+    "budget",
+])
+def test_relevant_sections_match_paragraph_scan(foia_request):
+    foia_words = tuple(foia_request.lower().split())
+
+    assert _extract_relevant_sections(CONTENT, CONTENT.lower(), foia_words) == \
+        _sections_by_paragraph_scan(CONTENT, foia_request)
+
+
+def test_repeated_request_word_counts_per_repeat():
+    sections = _extract_relevant_sections(CONTENT, CONTENT.lower(), ("contract", "contract"))
+
+    assert sections[:2] == [
+        "The contract was signed by the agency after a long review of the budget.",
+        "Only the contract is mentioned in this paragraph, and nothing else at all.",
+    ]
@@ -0,0 +1,55 @@
+import datetime
+from dataclasses import dataclass
+
+import pytest
+
+from foia_buddy.utils import fast_json
+
+BACKENDS = ["stdlib"] + (["orjson"] if fast_json.orjson is not None else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return request.param
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Opaque:
+    def __str__(self):
+        return "opaque"
+
+
+@pytest.mark.parametrize("obj, expected", [
+    ({"a": [1, 2.5, None, True], "b": "é"}, '{"a":[1,2.5,null,true],"b":"é"}'),
+    ({"big": 2 ** 70}, '{"big":1180591620717411303424}'),
+    ({1: "one", None: "none"}, '{"1":"one","null":"none"}'),
+    ({"when": datetime.datetime(2024, 1, 2, 3, 4, 5)}, '{"when":"2024-01-02 03:04:05"}'),
+    ({"point": Point(1, 2), "other": Opaque()}, '{"point":"Point(x=1, y=2)","other":"opaque"}'),
+])
+def test_dumps_is_backend_independent(backend, obj, expected):
+    assert fast_json.dumps(obj) == expected
+
+
+def test_dumps_indent(backend):
+    assert fast_json.dumps({"a": [1], "b": {}}, indent=True) == '{\n  "a": [\n    1\n  ],\n  "b": {}\n}'
+
+
+def test_dumps_rejects_unsupported_keys(backend):
+    with pytest.raises(TypeError):
+        fast_json.dumps({(1, 2): "pair"})
+
+
+def test_loads_accepts_text_and_bytes(backend):
+    assert fast_json.loads('{"a": 1}') == fast_json.loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_loads_raises_json_decode_error(backend):
+    with pytest.raises(fast_json.json.JSONDecodeError):
+        fast_json.loads(b"{")
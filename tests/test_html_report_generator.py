@@ -0,0 +1,47 @@
+from foia_buddy.agents.html_report_generator import HTMLReportGeneratorAgent
+from foia_buddy.utils import fast_json
+
+UNSAFE = "<script>alert(1)</script> & co"
+
+
+def _metadata(input_file="request.md", reasoning="Done"):
+    return {
+        "status": "completed",
+        "processing_time": 1.5,
+        "processing_start": 0,
+        "input_file": input_file,
+        "output_directory": "out",
+        "agent_results": {
+            "coordinator": {"success": True, "execution_time": 0.5, "confidence": 0.9,
+                            "reasoning": "Planned", "data": {}},
+            "report_generator": {"success": False, "execution_time": 1.0, "confidence": 0.4,
+                                 "reasoning": reasoning, "data": {"note": UNSAFE}},
+        },
+    }
+
+
+def test_request_and_agent_fields_are_escaped():
+    agent = HTMLReportGeneratorAgent(nvidia_client=None)
+    report = agent._generate_html_report(_metadata(input_file=UNSAFE, reasoning=UNSAFE))
+
+    assert UNSAFE not in report
+    assert "&lt;script&gt;alert(1)&lt;/script&gt; &amp; co" in report
+
+
+def test_render_many_matches_sequential_generation(tmp_path):
+    agent = HTMLReportGeneratorAgent(nvidia_client=None)
+    pairs = []
+    expected = []
+    for i in range(3):
+        metadata = _metadata(input_file=f"request_{i}.md", reasoning=f"Reason {i}")
+        metadata_path = tmp_path / f"metadata_{i}.json"
+        metadata_path.write_text(fast_json.dumps(metadata), encoding="utf-8")
+        pairs.append((str(metadata_path), str(tmp_path / "out" / f"report_{i}.html")))
+        expected.append(agent._generate_html_report(metadata))
+
+    outputs = HTMLReportGeneratorAgent.render_many(pairs, max_workers=2)
+
+    assert outputs == [output_path for _, output_path in pairs]
+    for output_path, html in zip(outputs, expected):
+        with open(output_path, encoding="utf-8", newline="") as f:
+            assert f.read() == html
@@ -0,0 +1,84 @@
+import asyncio
+import os
+
+import pytest
+
+from foia_buddy.agents import interactive_ui_generator
+from foia_buddy.agents.interactive_ui_generator import (
+    InteractiveUIGeneratorAgent,
+    MarkdownIt,
+    _UI_CACHE_DIR,
+    _UI_CACHE_MAX_ENTRIES,
+)
+from foia_buddy.models import TaskMessage
+
+UNSAFE_MARKDOWN = "# Request\n\n<script>alert(1)</script>\n\nText </div> after"
+
+
+@pytest.fixture
+def agent():
+    return InteractiveUIGeneratorAgent(nvidia_client=None)
+
+
+@pytest.mark.skipif(MarkdownIt is None, reason="markdown-it-py not installed")
+def test_prerendered_markdown_escapes_raw_html(agent):
+    html = agent._generate_interactive_ui(UNSAFE_MARKDOWN, UNSAFE_MARKDOWN, False, {})
+
+    assert "<script>alert(1)</script>" not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert "Text &lt;/div&gt; after" in html
+
+
+def test_embedded_markdown_cannot_close_script_block(agent):
+    agent._markdown = None
+    html = agent._generate_interactive_ui(UNSAFE_MARKDOWN, UNSAFE_MARKDOWN, False, {})
+
+    assert "<script>alert(1)</script>" not in html
+    assert "\\u003cscript>alert(1)\\u003c/script>" in html
+
+
+def _generate(agent, output_dir, report):
+    (output_dir / "final_report.md").write_text(report, encoding="utf-8")
+    task = TaskMessage(
+        task_id="t",
+        agent_type="interactive_ui_generator",
+        instructions="render",
+        context={"output_dir": str(output_dir), "input_file": "", "auto_open": False}
+    )
+    result = asyncio.run(agent.execute(task))
+    assert result.success, result.data
+    return result.data
+
+
+def test_cache_hit_refreshes_viewer_mtime(agent, tmp_path):
+    viewer = tmp_path / "interactive_viewer.html"
+    assert not _generate(agent, tmp_path, "# Report")["from_cache"]
+    os.utime(viewer, (0, 0))
+
+    assert _generate(agent, tmp_path, "# Report")["from_cache"]
+    assert viewer.stat().st_mtime > 0
+    assert viewer.stat().st_nlink == 1
+
+
+def test_ui_cache_is_bounded(agent, tmp_path):
+    for i in range(_UI_CACHE_MAX_ENTRIES + 3):
+        _generate(agent, tmp_path, f"# Report {i}")
+
+    cached = list((tmp_path / _UI_CACHE_DIR).glob("*.html"))
+    assert len(cached) == _UI_CACHE_MAX_ENTRIES
+
+
+def test_cache_miss_stores_the_viewer_as_rendered(agent, tmp_path):
+    _generate(agent, tmp_path, "# Report")
+
+    viewer = (tmp_path / "interactive_viewer.html").read_bytes()
+    (cached,) = (tmp_path / _UI_CACHE_DIR).glob("*.html")
+    assert cached.read_bytes() == viewer
+    assert not list(tmp_path.glob("**/*.tmp"))
+
+
+def test_template_change_misses_earlier_renders(agent, tmp_path, monkeypatch):
+    _generate(agent, tmp_path, "# Report")
+    monkeypatch.setattr(interactive_ui_generator, "_TEMPLATE_DIGEST", b"changed")
+
+    assert not _generate(agent, tmp_path, "# Report")["from_cache"]
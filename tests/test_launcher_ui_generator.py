@@ -0,0 +1,32 @@
+import asyncio
+
+from foia_buddy.agents.launcher_ui_generator import LauncherUIGeneratorAgent
+from foia_buddy.models import TaskMessage
+from foia_buddy.utils import fast_json
+
+
+def _generate(output_dir):
+    task = TaskMessage(
+        task_id="t",
+        agent_type="launcher_ui_generator",
+        instructions="launcher",
+        context={"output_dir": str(output_dir), "auto_open": False}
+    )
+    result = asyncio.run(LauncherUIGeneratorAgent(nvidia_client=None).execute(task))
+    assert result.success, result.data
+
+
+def test_index_json_follows_the_page_with_a_new_generation(tmp_path):
+    page = tmp_path / "index.html"
+    index = tmp_path / "index.json"
+
+    _generate(tmp_path)
+    first = fast_json.loads(index.read_bytes())
+    assert index.stat().st_mtime_ns >= page.stat().st_mtime_ns
+    assert f"const generation = {first['generation']!r};" in page.read_text(encoding="utf-8")
+
+    _generate(tmp_path)
+    second = fast_json.loads(index.read_bytes())
+    assert second["generation"] != first["generation"]
+    assert index.stat().st_mtime_ns >= page.stat().st_mtime_ns
+    assert f"const generation = {second['generation']!r};" in page.read_text(encoding="utf-8")
@@ -0,0 +1,94 @@
+import asyncio
+import os
+
+import pytest
+
+from foia_buddy.agents.local_pdf_search import LocalPDFSearchAgent, _extract_keywords, _match_filenames
+from foia_buddy.models import TaskMessage
+
+
+def _touch_dir(path):
+    # Bump the directory mtime explicitly; filesystem timestamps can be coarse
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def pdf_tree(tmp_path):
+    (tmp_path / "top.pdf").write_bytes(b"%PDF top")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "nested.pdf").write_bytes(b"%PDF nested")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "skipped.pdf").write_bytes(b"%PDF hidden")
+    return tmp_path
+
+
+def test_scan_skips_hidden_directories(pdf_tree):
+    agent = LocalPDFSearchAgent(nvidia_client=None, pdf_directory=str(pdf_tree))
+
+    assert sorted(agent.get_pdf_list()) == ["nested.pdf", "top.pdf"]
+
+
+def test_cache_sees_changes_in_subdirectories(pdf_tree):
+    agent = LocalPDFSearchAgent(nvidia_client=None, pdf_directory=str(pdf_tree))
+    assert agent.get_pdf_count() == 2
+
+    (pdf_tree / "sub" / "added.pdf").write_bytes(b"%PDF added")
+    _touch_dir(pdf_tree / "sub")
+    assert agent.get_pdf_count() == 3
+
+    (pdf_tree / "sub" / "nested.pdf").unlink()
+    _touch_dir(pdf_tree / "sub")
+    assert sorted(agent.get_pdf_list()) == ["added.pdf", "top.pdf"]
+
+
+def test_cache_reused_while_tree_is_unchanged(pdf_tree, monkeypatch):
+    agent = LocalPDFSearchAgent(nvidia_client=None, pdf_directory=str(pdf_tree))
+    agent.get_pdf_count()
+
+    def fail_walk(*args, **kwargs):
+        raise AssertionError("tree was walked again")
+
+    monkeypatch.setattr(LocalPDFSearchAgent, "_walk_pdfs", staticmethod(fail_walk))
+    assert agent.get_pdf_count() == 2
+
+
+def test_execute_reuses_the_scan_cache(pdf_tree, monkeypatch):
+    agent = LocalPDFSearchAgent(nvidia_client=None, pdf_directory=str(pdf_tree))
+    task = TaskMessage(task_id="t", agent_type="local_pdf_search", instructions="search", context={})
+    assert asyncio.run(agent.execute(task)).data["total_pdfs_found"] == 2
+
+    def fail_walk(*args, **kwargs):
+        raise AssertionError("tree was walked again")
+
+    monkeypatch.setattr(LocalPDFSearchAgent, "_walk_pdfs", staticmethod(fail_walk))
+    result = asyncio.run(agent.execute(task))
+    assert result.success, result.data
+    assert result.data["total_pdfs_found"] == 2
+
+
+def test_missing_directory_has_no_pdfs(tmp_path):
+    agent = LocalPDFSearchAgent(nvidia_client=None, pdf_directory=str(tmp_path / "missing"))
+
+    assert agent.get_pdf_count() == 0
+
+
+@pytest.mark.parametrize("stems, keywords", [
+    (["policy_memo_2023", "ai_report", "budget"], ("policy", "ai", "report", "memo")),
+    (["aaa", "a", "", "aa"], ("a", "aa")),
+    (["foia_ai_ai_ai"], ("ai",)),
+    ([], ("ai",)),
+])
+def test_match_filenames_matches_per_file_scan(stems, keywords):
+    matched, boosted = _match_filenames(stems, keywords)
+
+    assert matched == [[keyword for keyword in keywords if keyword in stem] for stem in stems]
+    assert boosted == [
+        any(term in stem for term in ("foia", "policy", "memo", "report")) for stem in stems
+    ]
+
+
+def test_extract_keywords_dedupes_and_keeps_quoted_phrases():
+    keywords = _extract_keywords('Policy memo on "drone program" and policy memos')
+
+    assert keywords == ("policy", "memo", "drone program")
@@ -0,0 +1,30 @@
+from foia_buddy.utils.minify import minify_css, minify_js
+
+
+def test_minify_css_strips_comments_and_whitespace():
+    css = """
+    /* header */
+    .tab > button ,
+    .tab a {
+        color : red ;
+        margin: 0 auto;
+    }
+    """
+
+    assert minify_css(css) == ".tab>button,.tab a{color:red;margin:0 auto}"
+
+
+def test_minify_js_keeps_line_breaks():
+    script = """
+        // setup
+        const a = 1
+        const url = "http://example.gov";
+
+            function f() {
+                return a
+            }
+    """
+
+    assert minify_js(script) == (
+        'const a = 1\nconst url = "http://example.gov";\nfunction f() {\nreturn a\n}'
+    )
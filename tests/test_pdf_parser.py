@@ -0,0 +1,241 @@
+import asyncio
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from foia_buddy.agents import pdf_parser
+from foia_buddy.agents.pdf_parser import PDFParserAgent
+from foia_buddy.models import TaskMessage
+
+
+class FakeNvidiaClient:
+    api_key = "test-key"
+
+
+def _fake_render(pdf_path, first_index, count, dpi, image_format):
+    return f"{first_index}:{count}".encode("ascii")
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """A parser whose pages render in-thread and whose model echoes the page."""
+    monkeypatch.setattr(pdf_parser, "_require_pdf_renderer", lambda: None)
+    monkeypatch.setattr(pdf_parser, "_get_render_executor", lambda: None)
+    monkeypatch.setattr(pdf_parser, "_render_and_encode_pages", _fake_render)
+    monkeypatch.setattr(
+        pdf_parser, "_count_pages",
+        lambda pdf_path: int(open(pdf_path, "rb").read().split(b"pages=")[1])
+    )
+
+    parser = PDFParserAgent(FakeNvidiaClient())
+    parser.vl_calls = []
+
+    async def call_vl_model(b64_data, mime, tool_name=None):
+        parser.vl_calls.append(b64_data)
+        return f"parsed {b64_data.decode('ascii')}"
+
+    parser._call_vl_model = call_vl_model
+    return parser
+
+
+def _write_pdf(directory, name, pages):
+    path = directory / name
+    path.write_bytes(f"%PDF pages={pages}".encode("ascii"))
+    return str(path)
+
+
+def _parse_batch(agent, pdf_paths, output_dir):
+    task = TaskMessage(
+        task_id="t",
+        agent_type="pdf_parser",
+        instructions="parse",
+        context={"pdf_paths": pdf_paths, "output_dir": str(output_dir)}
+    )
+    return asyncio.run(agent.execute(task)).data
+
+
+def test_identical_pdfs_in_a_batch_are_parsed_once(agent, tmp_path):
+    first = _write_pdf(tmp_path, "first.pdf", 2)
+    copy = _write_pdf(tmp_path, "copy.pdf", 2)
+    output_dir = tmp_path / "out"
+
+    data = _parse_batch(agent, [first, copy], output_dir)
+
+    assert [doc["status"] for doc in data["parsed_documents"]] == ["success", "cache_hit"]
+    assert len(agent.vl_calls) == 2
+    assert (output_dir / "copy.md").read_text() == (output_dir / "first.md").read_text()
+
+
+def test_same_named_pdfs_in_a_batch_keep_separate_outputs(agent, tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    first = _write_pdf(tmp_path / "a", "report.pdf", 2)
+    second = _write_pdf(tmp_path / "b", "report.pdf", 3)
+    output_dir = tmp_path / "out"
+
+    for expected_status in ("success", "cache_hit"):
+        data = _parse_batch(agent, [first, second], output_dir)
+
+        documents = data["parsed_documents"]
+        assert [doc["status"] for doc in documents] == [expected_status] * 2
+        assert [doc["markdown_filename"] for doc in documents] == ["report.md", "report-2.md"]
+        assert (output_dir / "report.md").read_text().count("# Page") == 2
+        assert (output_dir / "report-2.md").read_text().count("# Page") == 3
+
+    assert sorted(path.name for path in output_dir.iterdir()) == [".cache", "report-2.md", "report.md"]
+
+
+def test_editing_output_does_not_change_cache(agent, tmp_path):
+    pdf = _write_pdf(tmp_path, "doc.pdf", 1)
+    output_dir = tmp_path / "out"
+    _parse_batch(agent, [pdf], output_dir)
+    original = (output_dir / "doc.md").read_text()
+
+    (output_dir / "doc.md").write_text("edited")
+    data = _parse_batch(agent, [pdf], output_dir)
+
+    assert data["parsed_documents"][0]["status"] == "cache_hit"
+    assert (output_dir / "doc.md").read_text() == original
+
+
+class FakeAsyncClient:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.closed = False
+        FakeAsyncClient.instances.append(self)
+
+    async def post(self, url, headers=None, content=None):
+        body = json.dumps({"choices": [{"message": {"content": "page text"}}]})
+        return SimpleNamespace(is_error=False, content=body.encode("utf-8"))
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_execute_closes_its_http_client(agent, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        pdf_parser, "httpx", SimpleNamespace(AsyncClient=FakeAsyncClient, Limits=lambda **kwargs: None)
+    )
+    FakeAsyncClient.instances = []
+    del agent._call_vl_model  # use the real request path
+    pdf = _write_pdf(tmp_path, "doc.pdf", 2)
+
+    data = _parse_batch(agent, [pdf], tmp_path / "out")
+
+    assert data["parsed_count"] == 1
+    assert len(FakeAsyncClient.instances) == 1
+    assert FakeAsyncClient.instances[0].closed
+    assert agent._http_client is None
+
+
+def _page_index(b64_data):
+    return int(base64.b64decode(b64_data).split(b":")[0])
+
+
+def test_pages_written_in_order_when_completed_out_of_order(agent, tmp_path):
+    completed = []
+
+    async def call_vl_model(b64_data, mime, tool_name=None):
+        page_index = _page_index(b64_data)
+        # Later pages answer first
+        await asyncio.sleep(0.02 * (4 - page_index))
+        completed.append(page_index)
+        return f"text {page_index}"
+
+    agent._call_vl_model = call_vl_model
+    pdf = _write_pdf(tmp_path, "doc.pdf", 4)
+
+    data = _parse_batch(agent, [pdf], tmp_path / "out")
+
+    assert completed == [3, 2, 1, 0]
+    markdown = (tmp_path / "out" / "doc.md").read_text()
+    assert markdown == pdf_parser._PAGE_SEPARATOR.join(
+        f"# Page {n}\n\ntext {n - 1}" for n in range(1, 5)
+    )
+    assert data["parsed_documents"][0]["markdown_length"] == len(markdown)
+    assert data["parsed_documents"][0]["pages_parsed"] == 4
+
+
+def test_failing_middle_page_cancels_the_rest_and_releases_slots(agent, tmp_path):
+    finished = []
+
+    async def call_vl_model(b64_data, mime, tool_name=None):
+        page_index = _page_index(b64_data)
+        if page_index == 1:
+            raise RuntimeError("page 2 failed")
+        # Pages after the failure would take far longer than the test
+        await asyncio.sleep(0 if page_index == 0 else 10)
+        finished.append(page_index)
+        return f"text {page_index}"
+
+    agent._call_vl_model = call_vl_model
+    pdf = _write_pdf(tmp_path, "doc.pdf", 4)
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+
+    async def run():
+        page_semaphore = asyncio.Semaphore(4)
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            await asyncio.wait_for(agent._parse_pdf(pdf, output_dir, page_semaphore), 5)
+        # Let the cancelled tasks finish unwinding
+        await asyncio.sleep(0)
+        return page_semaphore
+
+    page_semaphore = asyncio.run(run())
+
+    assert 2 not in finished and 3 not in finished
+    assert page_semaphore._value == 4
+    assert not (output_dir / pdf_parser._PARSE_CACHE_DIR).exists()
+    assert agent._parses_in_flight == {}
+
+
+def test_page_slots_released_when_tasks_cancelled_before_starting(agent, tmp_path):
+    async def call_vl_model(b64_data, mime, tool_name=None):
+        raise RuntimeError("boom")
+
+    agent._call_vl_model = call_vl_model
+    pdf = _write_pdf(tmp_path, "doc.pdf", 6)
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+
+    async def run():
+        page_semaphore = asyncio.Semaphore(2)
+        with pytest.raises(RuntimeError):
+            await agent._parse_pdf(pdf, output_dir, page_semaphore)
+        await asyncio.sleep(0)
+        return page_semaphore
+
+    assert asyncio.run(run())._value == 2
+
+
+def test_pages_per_request_groups_pages(agent, tmp_path):
+    agent.pages_per_request = 2
+    pdf = _write_pdf(tmp_path, "doc.pdf", 3)
+
+    _parse_batch(agent, [pdf], tmp_path / "out")
+
+    assert sorted(base64.b64decode(call) for call in agent.vl_calls) == [b"0:2", b"2:1"]
+    markdown = (tmp_path / "out" / "doc.md").read_text()
+    assert markdown.startswith("# Pages 1-2\n\n")
+    assert "# Page 3\n\n" in markdown
+
+
+def test_cache_hit_reports_stored_markdown_length(agent, tmp_path):
+    pdf = _write_pdf(tmp_path, "doc.pdf", 3)
+    output_dir = tmp_path / "out"
+    parsed = _parse_batch(agent, [pdf], output_dir)["parsed_documents"][0]
+    length_files = list((output_dir / pdf_parser._PARSE_CACHE_DIR).glob("*.len"))
+    assert [path.read_text() for path in length_files] == [str(parsed["markdown_length"])]
+
+    hit = _parse_batch(agent, [pdf], output_dir)["parsed_documents"][0]
+    assert hit["status"] == "cache_hit"
+    assert hit["markdown_length"] == parsed["markdown_length"]
+
+    # Entries without a stored length are measured
+    length_files[0].unlink()
+    hit = _parse_batch(agent, [pdf], output_dir)["parsed_documents"][0]
+    assert hit["markdown_length"] == parsed["markdown_length"]
+    assert length_files[0].exists()
@@ -0,0 +1,49 @@
+from foia_buddy.utils import ResponseCache
+from foia_buddy.utils import response_cache
+
+
+def test_get_returns_a_copy():
+    cache = ResponseCache()
+    cache.set("k", {"content": "text"})
+
+    cached = cache.get("k")
+    cached["content"] = "changed"
+
+    assert cache.get("k") == {"content": "text"}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", {"content": "a"})
+    cache.set("b", {"content": "b"})
+    cache.get("a")
+    cache.set("c", {"content": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"content": "a"}
+    assert cache.get("c") == {"content": "c"}
+
+
+def test_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl_seconds=10)
+    cache.set("k", {"content": "text"})
+
+    now[0] += 11
+
+    assert cache.get("k") is None
+
+
+def test_errors_are_not_cached():
+    cache = ResponseCache()
+    cache.set("k", {"error": "rate limited"})
+
+    assert cache.get("k") is None
+
+
+def test_key_depends_on_messages_and_thinking():
+    messages = [{"role": "user", "content": "hello"}]
+
+    assert ResponseCache.make_key(messages, True) == ResponseCache.make_key(list(messages), True)
+    assert ResponseCache.make_key(messages, True) != ResponseCache.make_key(messages, False)